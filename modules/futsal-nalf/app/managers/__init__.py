@@ -170,6 +170,12 @@ def get_recorder_manager():
     return _recorder_manager
 
 
+def invalidate_camera_cache():
+    """Invalidate Recorder Manager camera cache (no-op if not initialized yet)"""
+    if _recorder_manager is not None:
+        _recorder_manager.invalidate_camera_cache()
+
+
 def shutdown_all_managers():
     """
     Shutdown all managers
@@ -211,6 +217,7 @@ __all__ = [
     'get_current_game_manager',
     'get_recorder_manager',
     'get_timer_manager',
+    'invalidate_camera_cache',
     'shutdown_all_managers'
 ]
 
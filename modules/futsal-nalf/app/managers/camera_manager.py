@@ -2,6 +2,7 @@
 from typing import List, Optional
 from app.extensions import db
 from app.models.camera import Camera
+from app.managers import invalidate_camera_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,7 @@ class CameraManager:
             )
             db.session.add(camera)
             db.session.commit()
+            invalidate_camera_cache()
 
             logger.info(f"Created camera: {camera.name} ({camera.brand} {camera.model})")
             return camera
@@ -45,7 +47,7 @@ class CameraManager:
 
     def get_camera_by_id(self, camera_id: int) -> Optional[Camera]:
         """Get camera by ID"""
-        return Camera.query.get(camera_id)
+        return db.session.get(Camera, camera_id)
 
     def update_camera(self, camera_id: int, name: str = None, brand: str = None, 
                      model: str = None) -> Optional[Camera]:
@@ -75,6 +77,7 @@ class CameraManager:
                 camera.model = model
 
             db.session.commit()
+            invalidate_camera_cache()
             logger.info(f"Updated camera ID {camera_id}")
             return camera
 
@@ -103,6 +106,7 @@ class CameraManager:
         try:
             db.session.delete(camera)
             db.session.commit()
+            invalidate_camera_cache()
             logger.info(f"Deleted camera: {camera.name}")
             return True
 
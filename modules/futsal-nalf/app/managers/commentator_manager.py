@@ -43,7 +43,7 @@ class CommentatorManager:
 
     def get_commentator_by_id(self, commentator_id: int) -> Optional[Commentator]:
         """Get commentator by ID"""
-        return Commentator.query.get(commentator_id)
+        return db.session.get(Commentator, commentator_id)
 
     def update_commentator(self, commentator_id: int, first_name: str = None,
                       last_name: str = None) -> Optional[Commentator]:
@@ -14,17 +14,17 @@ class CurrentGameManager:
 
     def get_current_game(self):
         """Get current active game"""
-        settings = Settings.query.get(id=1).first()
+        settings = db.session.get(Settings, 1)
         self.current_game_id = settings.current_game_id
 
-        game = Game.query.get(self.current_game_id)
+        game = db.session.get(Game, self.current_game_id)
 
         return game
 
     def start_game(self, game_id=None):
         """Start a game"""
         if game_id:
-            game = Game.query.get(game_id)
+            game = db.session.get(Game, game_id)
         else:
             # Get next scheduled game
             game = Game.query.filter_by(status='scheduled').first()
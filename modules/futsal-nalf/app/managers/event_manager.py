@@ -57,7 +57,7 @@ class EventManager:
 
     def get_event_by_id(self, event_id: int) -> Optional[Event]:
         """Get event by ID"""
-        return Event.query.get(event_id)
+        return db.session.get(Event, event_id)
 
     def get_event_by_short_name(self, short_name: str) -> Optional[Event]:
         """Get event by short name"""
@@ -30,12 +30,12 @@ class GameCameraManager:
             ValueError if game/camera not found or unique constraints violated
         """
         # Validate game exists
-        game = Game.query.get(game_id)
+        game = db.session.get(Game, game_id)
         if not game:
             raise ValueError(f"Mecz o ID {game_id} nie istnieje")
 
         # Validate camera exists
-        camera = Camera.query.get(camera_id)
+        camera = db.session.get(Camera, camera_id)
         if not camera:
             raise ValueError(f"Kamera o ID {camera_id} nie istnieje")
 
@@ -72,7 +72,7 @@ class GameCameraManager:
 
     def get_game_camera_by_id(self, game_camera_id: int) -> Optional[GameCamera]:
         """Get GameCamera by ID"""
-        return GameCamera.query.get(game_camera_id)
+        return db.session.get(GameCamera, game_camera_id)
 
     def update_game_camera(self, game_camera_id: int, location: str = None,
                           is_motorized: bool = None) -> Optional[GameCamera]:
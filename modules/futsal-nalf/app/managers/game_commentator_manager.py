@@ -29,12 +29,12 @@ class GameCommentatorManager:
             ValueError if game/commentator not found, invalid type, or commentator already assigned
         """
         # Validate game exists
-        game = Game.query.get(game_id)
+        game = db.session.get(Game, game_id)
         if not game:
             raise ValueError(f"Mecz o ID {game_id} nie istnieje")
 
         # Validate commentator exists
-        commentator = Commentator.query.get(commentator_id)
+        commentator = db.session.get(Commentator, commentator_id)
         if not commentator:
             raise ValueError(f"Sędzia o ID {commentator_id} nie istnieje")
 
@@ -97,7 +97,7 @@ class GameCommentatorManager:
 
     def get_game_commentator_by_id(self, game_commentator_id: int) -> Optional[GameCommentator]:
         """Get GameCommentator by ID"""
-        return GameCommentator.query.get(game_commentator_id)
+        return db.session.get(GameCommentator, game_commentator_id)
 
     def update_game_commentator(self, game_commentator_id: int,
                            commentator_type: str = None) -> Optional[GameCommentator]:
@@ -36,12 +36,12 @@ class GameEventManager:
             ValueError if validation fails
         """
         # Validate game exists
-        game = Game.query.get(game_id)
+        game = db.session.get(Game, game_id)
         if not game:
             raise ValueError(f"Mecz o ID {game_id} nie istnieje")
 
         # Validate event exists
-        event = Event.query.get(event_id)
+        event = db.session.get(Event, event_id)
         if not event:
             raise ValueError(f"Typ zdarzenia o ID {event_id} nie istnieje")
 
@@ -53,7 +53,7 @@ class GameEventManager:
             period_id = current_period.id
         else:
             # Validate period exists and belongs to game
-            period = Period.query.get(period_id)
+            period = db.session.get(Period, period_id)
             if not period or period.game_id != game_id:
                 raise ValueError(f"Część o ID {period_id} nie istnieje lub nie należy do meczu {game_id}")
 
@@ -65,12 +65,12 @@ class GameEventManager:
                 raise ValueError(f"Zdarzenie '{event.name}' wymaga przypisania do zawodnika (player_id)")
             
             # Validate team exists
-            team = Team.query.get(team_id)
+            team = db.session.get(Team, team_id)
             if not team:
                 raise ValueError(f"Drużyna o ID {team_id} nie istnieje")
             
             # Validate player exists
-            player = Player.query.get(player_id)
+            player = db.session.get(Player, player_id)
             if not player:
                 raise ValueError(f"Zawodnik o ID {player_id} nie istnieje")
 
@@ -157,7 +157,7 @@ class GameEventManager:
 
     def get_game_event_by_id(self, game_event_id: int) -> Optional[GameEvent]:
         """Get GameEvent by ID"""
-        return GameEvent.query.get(game_event_id)
+        return db.session.get(GameEvent, game_event_id)
 
     def update_game_event(self, game_event_id: int, time: int = None,
                          team_id: int = None, player_id: int = None) -> Optional[GameEvent]:
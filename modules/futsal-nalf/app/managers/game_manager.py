@@ -14,7 +14,7 @@ logger = logging.getLogger(__name__)
 class GameManager:
     """Manages CRUD operations for games (games)"""
 
-    def get_all_games(self, league_id=None, team_id=None, status=None):
+    def get_all_games(self, league_id=None, team_id=None, status=None, for_dict=False, mode='full'):
         """
         Get all games with optional filters
 
@@ -22,12 +22,17 @@ class GameManager:
             league_id: Filter by league ID (optional)
             team_id: Filter by team ID (home or away) (optional)
             status: Filter by status (optional)
+            for_dict: Eager-load what Game.to_dict() reads (optional)
+            mode: Game.to_dict() mode to eager-load for (default: 'full')
 
         Returns:
             List of Game objects
         """
         query = Game.query
 
+        if for_dict:
+            query = query.options(*Game.to_dict_options(mode))
+
         if league_id:
             query = query.filter_by(league_id=league_id)
 
@@ -43,10 +48,16 @@ class GameManager:
 
     def get_game_by_id(self, game_id):
         """Get game by ID"""
-        return Game.query.get(game_id)
+        return db.session.get(Game, game_id)
+
+    def get_game_for_dict(self, game_id, mode='full'):
+        """Get game by ID with what Game.to_dict(mode) reads eager-loaded"""
+        if mode == 'summary':
+            return Game.load_for_summary(game_id)
+        return Game.load_for_dict(game_id)
     
     def get_game_by_foreign_id(self, foreign_id):
-        return Game.query.get(foreign_id)
+        return Game.query.filter_by(foreign_id=foreign_id).first()
 
     def create_game(self, home_team_id, away_team_id, league_id, stadium_id,
                      round_number, group_nr=1, date=None, foreign_id=None):
@@ -69,11 +80,11 @@ class GameManager:
             ValueError if validation fails
         """
         # Validate teams exist and are different
-        home_team = Team.query.get(home_team_id)
+        home_team = db.session.get(Team, home_team_id)
         if not home_team:
             raise ValueError(f"Nie znaleziono gospodarza o ID {home_team_id}")
 
-        away_team = Team.query.get(away_team_id)
+        away_team = db.session.get(Team, away_team_id)
         if not away_team:
             raise ValueError(f"Nie znaleziono gościa o ID {away_team_id}")
 
@@ -81,12 +92,12 @@ class GameManager:
             raise ValueError("Gospodarz i gość nie mogą być tą samą drużyną")
 
         # Validate league exists
-        league = League.query.get(league_id)
+        league = db.session.get(League, league_id)
         if not league:
             raise ValueError(f"Nie znaleziono ligi o ID {league_id}")
 
         # Validate stadium exists
-        stadium = Stadium.query.get(stadium_id)
+        stadium = db.session.get(Stadium, stadium_id)
         if not stadium:
             raise ValueError(f"Nie znaleziono stadionu o ID {stadium_id}")
 
@@ -146,7 +157,7 @@ class GameManager:
             print(f'is_home_team_lost_by_wo: {is_home_team_lost_by_wo}, type{type(is_home_team_lost_by_wo)}')
             print('-----------------------------------------------')
             if home_team_id is not None and home_team_id != game.home_team_id:
-                home_team = Team.query.get(home_team_id)
+                home_team = db.session.get(Team, home_team_id)
                 if not home_team:
                     raise ValueError(f"Nie znaleziono gospodarza o ID {home_team_id}")
                 if home_team_id == game.away_team_id:
@@ -155,7 +166,7 @@ class GameManager:
 
             # Update away team if provided
             if away_team_id is not None and away_team_id != game.away_team_id:
-                away_team = Team.query.get(away_team_id)
+                away_team = db.session.get(Team, away_team_id)
                 if not away_team:
                     raise ValueError(f"Nie znaleziono gościa o ID {away_team_id}")
                 if away_team_id == game.home_team_id:
@@ -174,7 +185,7 @@ class GameManager:
 
             # Update stadium if provided
             if stadium_id is not None and stadium_id != game.stadium_id:
-                stadium = Stadium.query.get(stadium_id)
+                stadium = db.session.get(Stadium, stadium_id)
                 if not stadium:
                     raise ValueError(f"Nie znaleziono stadionu o ID {stadium_id}")
                 game.stadium_id = stadium_id
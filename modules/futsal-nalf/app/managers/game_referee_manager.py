@@ -29,12 +29,12 @@ class GameRefereeManager:
             ValueError if game/referee not found, invalid type, or referee already assigned
         """
         # Validate game exists
-        game = Game.query.get(game_id)
+        game = db.session.get(Game, game_id)
         if not game:
             raise ValueError(f"Mecz o ID {game_id} nie istnieje")
 
         # Validate referee exists
-        referee = Referee.query.get(referee_id)
+        referee = db.session.get(Referee, referee_id)
         if not referee:
             raise ValueError(f"Sędzia o ID {referee_id} nie istnieje")
 
@@ -97,7 +97,7 @@ class GameRefereeManager:
 
     def get_game_referee_by_id(self, game_referee_id: int) -> Optional[GameReferee]:
         """Get GameReferee by ID"""
-        return GameReferee.query.get(game_referee_id)
+        return db.session.get(GameReferee, game_referee_id)
 
     def update_game_referee(self, game_referee_id: int,
                            referee_type: str = None) -> Optional[GameReferee]:
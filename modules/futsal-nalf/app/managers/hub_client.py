@@ -5,6 +5,10 @@ import threading
 import time
 from datetime import datetime
 
+# Compact separators and raw UTF-8 keep outbound frames small (Polish
+# names would otherwise be \u-escaped)
+_json_encode = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+
 
 class HubClient:
     """WebSocket client for Hub communication"""
@@ -163,8 +167,9 @@ class HubClient:
             if 'timestamp' not in message:
                 message['timestamp'] = datetime.utcnow().isoformat()
 
+            data = _json_encode(message)
             with self._lock:
-                self.ws.send(json.dumps(message))
+                self.ws.send(data)
 
             return True
 
@@ -200,6 +205,22 @@ class HubClient:
             'payload': payload
         })
 
+    def send_batch_to_plugin(self, plugin_id, messages):
+        """
+        Send several messages to a plugin in one WebSocket frame
+
+        Args:
+            plugin_id: Target plugin
+            messages: List of {'type': ..., 'payload': ...} dicts,
+                dispatched by the plugin in order
+        """
+        return self.send({
+            'from': self.module_id,
+            'to': plugin_id,
+            'type': 'batch',
+            'payload': {'messages': messages}
+        })
+
     # ✅ NEW: Subscribe to classes
     def subscribe_to_classes(self, classes):
         """
@@ -341,20 +362,12 @@ class HubClient:
             from app.managers import get_timer_manager
             timer_manager = get_timer_manager()
 
-            if msg_type == 'timer_updated':
-                timer_manager.on_timer_updated(msg)
+            if msg_type in timer_manager.STATE_MESSAGES:
+                timer_manager.on_timer_state_changed(msg)
             elif msg_type == 'timer_event':
                 timer_manager.on_timer_event(msg)
             elif msg_type == 'timer_created':
                 timer_manager.on_timer_created(msg)
-            elif msg_type == 'timer_started':
-                timer_manager.on_timer_started(msg)
-            elif msg_type == 'timer_paused':
-                timer_manager.on_timer_paused(msg)
-            elif msg_type == 'timer_reset':
-                timer_manager.on_timer_reset(msg)
-            elif msg_type == 'timer_adjusted':
-                timer_manager.on_timer_adjusted(msg)
             elif msg_type == 'all_timers':
                 timer_manager.on_all_timers(msg)
             elif msg_type == 'limit_reached':
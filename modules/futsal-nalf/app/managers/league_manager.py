@@ -30,7 +30,7 @@ class LeagueManager:
 
     def get_league_by_id(self, league_id):
         """Get league by ID"""
-        return League.query.get(league_id)
+        return db.session.get(League, league_id)
 
     def create_league(self, season_id, name, games_url, scorers_url, assists_url,
                       canadian_url, table_url=None, foreign_id=None):
@@ -53,7 +53,7 @@ class LeagueManager:
             ValueError if validation fails
         """
         # Validate season exists
-        season = Season.query.get(season_id)
+        season = db.session.get(Season, season_id)
         if not season:
             raise ValueError(f"Nie znaleziono sezonu o ID {season_id}")
 
@@ -205,10 +205,15 @@ class LeagueManager:
         from app.models.game import Game
 
         teams = league.get_teams()
-        total_games = league.total_games
-        finished_games = league.games.filter_by(status=Game.STATUS_FINISHED).count()
-        live_games = league.games.filter_by(status=Game.STATUS_PENDING).count()
-        upcoming_games = league.games.filter_by(status=Game.STATUS_NOT_STARTED).count()
+
+        # Game counts per status in one query
+        status_counts = dict(db.session.query(Game.status, db.func.count(Game.id)).filter_by(
+            league_id=league_id
+        ).group_by(Game.status).all())
+        total_games = sum(status_counts.values())
+        finished_games = status_counts.get(Game.STATUS_FINISHED, 0)
+        live_games = status_counts.get(Game.STATUS_PENDING, 0)
+        upcoming_games = status_counts.get(Game.STATUS_NOT_STARTED, 0)
 
         # Get groups
         groups = db.session.query(LeagueTeam.group_nr).filter_by(
@@ -217,7 +222,7 @@ class LeagueManager:
         groups = [g[0] for g in groups]
 
         return {
-            'league': league.to_dict(),
+            'league': league.to_dict(total_teams=len(teams), total_games=total_games),
             'teams': [lt.to_dict() for lt in teams],
             'total_teams': len(teams),
             'groups': groups,
@@ -247,7 +252,7 @@ class LeagueManager:
         if not league:
             raise ValueError(f"Nie znaleziono ligi o ID {league_id}")
 
-        team = Team.query.get(team_id)
+        team = db.session.get(Team, team_id)
         if not team:
             raise ValueError(f"Nie znaleziono zespołu o ID {team_id}")
 
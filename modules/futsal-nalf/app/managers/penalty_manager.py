@@ -1,8 +1,10 @@
 """Penalty Manager - handles penalty shootout operations"""
 from typing import Optional
 from app.extensions import db
+from sqlalchemy.exc import IntegrityError
 from app.models.penalty import Penalty
 from app.models.game import Game
+from app.utils.team_side import TeamSide
 import logging
 
 logger = logging.getLogger(__name__)
@@ -28,15 +30,12 @@ class PenaltyManager:
             ValueError if game not found or penalty shootout already exists
         """
         # Validate game exists
-        game = Game.query.get(game_id)
+        game = db.session.get(Game, game_id)
         if not game:
             raise ValueError(f"Mecz o ID {game_id} nie istnieje")
         
-        # Check if penalty shootout already exists
-        existing = Penalty.query.filter_by(game_id=game_id).first()
-        if existing:
-            raise ValueError(f"Konkurs rzutów karnych już istnieje dla meczu {game_id}")
-        
+        # Duplicates are rejected by the UNIQUE(game_id) constraint on penalties,
+        # so there is no separate existence SELECT here
         try:
             penalty = Penalty(
                 game_id=game_id,
@@ -49,6 +48,11 @@ class PenaltyManager:
             logger.info(f"Created penalty shootout for game {game_id}: {home_penalties}:{away_penalties}")
             return penalty
         
+        except IntegrityError as e:
+            db.session.rollback()
+            logger.error(f"IntegrityError creating penalty shootout: {e}")
+            raise ValueError(f"Konkurs rzutów karnych już istnieje dla meczu {game_id}")
+        
         except Exception as e:
             db.session.rollback()
             logger.error(f"Error creating penalty shootout: {e}")
@@ -60,7 +64,7 @@ class PenaltyManager:
 
     def get_penalty_by_id(self, penalty_id: int) -> Optional[Penalty]:
         """Get penalty shootout by ID"""
-        return Penalty.query.get(penalty_id)
+        return db.session.get(Penalty, penalty_id)
 
     def update_penalty_score(self, penalty_id: int, home_penalties: int, 
                             away_penalties: int) -> Optional[Penalty]:
@@ -92,13 +96,13 @@ class PenaltyManager:
             logger.error(f"Error updating penalty score: {e}")
             return None
 
-    def increment_penalty_goal(self, penalty_id: int, team: str) -> Optional[Penalty]:
+    def increment_penalty_goal(self, penalty_id: int, team: TeamSide) -> Optional[Penalty]:
         """
         Increment penalty goal for a team
         
         Args:
             penalty_id: Penalty ID
-            team: 'home' or 'away'
+            team: TeamSide.HOME or TeamSide.AWAY (use TeamSide.parse() for strings)
         
         Returns:
             Updated Penalty object or None if error
@@ -109,16 +113,16 @@ class PenaltyManager:
             return None
         
         try:
-            if team.lower() == 'home':
+            if team == TeamSide.HOME:
                 penalty.increment_home_penalties()
-            elif team.lower() == 'away':
+            elif team == TeamSide.AWAY:
                 penalty.increment_away_penalties()
             else:
-                raise ValueError(f"Invalid team: {team}. Must be 'home' or 'away'")
+                raise ValueError(f"Invalid team: {team}. Must be TeamSide.HOME or TeamSide.AWAY")
             
             db.session.commit()
             
-            logger.info(f"Incremented {team} penalty goal for penalty {penalty_id}")
+            logger.info(f"Incremented {team.name} penalty goal for penalty {penalty_id}")
             return penalty
         
         except Exception as e:
@@ -3,6 +3,7 @@ from typing import List, Optional
 from app.extensions import db
 from app.models.period import Period
 from app.models.game import Game
+from app.utils.team_side import TeamSide
 import logging
 
 logger = logging.getLogger(__name__)
@@ -32,7 +33,7 @@ class PeriodManager:
             ValueError if game not found or period_order already exists
         """
         # Validate game exists
-        game = Game.query.get(game_id)
+        game = db.session.get(Game, game_id)
         if not game:
             raise ValueError(f"Mecz o ID {game_id} nie istnieje")
 
@@ -111,9 +112,17 @@ class PeriodManager:
         """Get all periods for a game, ordered by period_order"""
         return Period.query.filter_by(game_id=game_id).order_by(Period.period_order).all()
 
-    def get_period_by_id(self, period_id: int) -> Optional[Period]:
-        """Get period by ID"""
-        return Period.query.get(period_id)
+    def get_period_by_id(self, period_id: int, for_update: bool = False) -> Optional[Period]:
+        """
+        Get period by ID
+
+        Args:
+            period_id: Period ID
+            for_update: Lock the row (SELECT ... FOR UPDATE) when the caller mutates it
+        """
+        if for_update:
+            return Period.query.filter_by(id=period_id).with_for_update().first()
+        return db.session.get(Period, period_id)
 
     def update_period(self, period_id: int, description: str = None, 
                      limit_time: int = None, pause_at_limit: bool = None,
@@ -274,10 +283,16 @@ class PeriodManager:
         from app.models.settings import Settings
         from app.managers import get_timer_manager
         
-        period = self.get_period_by_id(period_id)
+        # Lock the period row so concurrent finish requests serialize; the
+        # lock is held until the single commit at the end
+        period = self.get_period_by_id(period_id, for_update=True)
         if not period:
             return None
         
+        # A concurrent request already finished it while we waited
+        if period.status == Period.STATUS_FINISHED:
+            return period
+        
         timer_manager = get_timer_manager()
         current_timers = Settings.get_current_timers()
         
@@ -292,11 +307,10 @@ class PeriodManager:
             if timer_state:
                 main_timer["state"] = timer_state.get("state", "paused")
                 main_timer["initial_time"] = timer_state.get("elapsed_time", main_timer.get("initial_time", 0))
-                Settings.update_main_timer(main_timer)
         
         # Stop and update all penalty timers
         penalties = current_timers.get("penalties", [])
-        for i, penalty in enumerate(penalties):
+        for penalty in penalties:
             timer_id = penalty.get("timer_id")
             if timer_id:
                 timer_state = timer_manager.get_timer_state(timer_id)
@@ -307,10 +321,19 @@ class PeriodManager:
                 if timer_state:
                     penalty["state"] = timer_state.get("state", "paused")
                     penalty["initial_time"] = timer_state.get("elapsed_time", penalty.get("initial_time", 0))
-                    Settings.update_penalty_timer(timer_id, penalty)
         
-        # Set period status to FINISHED
-        return self.set_period_status(period_id, Period.STATUS_FINISHED)
+        try:
+            # Set period status to FINISHED; committed together with the
+            # timer states by set_current_timers()
+            period.status = Period.STATUS_FINISHED
+            Settings.set_current_timers(current_timers)
+            logger.info(f"Finished period ID {period_id}")
+            return period
+
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error finishing period: {e}")
+            return None
 
     def delete_period(self, period_id: int) -> bool:
         """
@@ -338,12 +361,19 @@ class PeriodManager:
             logger.error(f"Error deleting period: {e}")
             return False
 
-    def get_current_period(self, game_id: int) -> Optional[Period]:
-        """Get currently active period for a game"""
-        return Period.query.filter_by(
+    def get_current_period(self, game_id: int, for_update: bool = False) -> Optional[Period]:
+        """
+        Get currently active period for a game
+
+        Args:
+            game_id: Game ID
+            for_update: Lock the row (SELECT ... FOR UPDATE) when the caller mutates it
+        """
+        query = Period.query.filter_by(
             game_id=game_id,
             status=Period.STATUS_PENDING
-        ).first()
+        )
+        return (query.with_for_update() if for_update else query).first()
 
     def update_period_score(self, period_id: int, home_goals: int, away_goals: int,
                            auto_sync: bool = True) -> Optional[Period]:
@@ -413,13 +443,13 @@ class PeriodManager:
             logger.error(f"Error updating period fouls: {e}")
             return None
 
-    def increment_period_goal(self, period_id: int, team: str, auto_sync: bool = True) -> Optional[Period]:
+    def increment_period_goal(self, period_id: int, team: TeamSide, auto_sync: bool = True) -> Optional[Period]:
         """
         Increment goal for a team in a period
         
         Args:
             period_id: Period ID
-            team: 'home' or 'away'
+            team: TeamSide.HOME or TeamSide.AWAY (use TeamSide.parse() for strings)
             auto_sync: Automatically sync to Game (default: True)
         
         Returns:
@@ -431,19 +461,19 @@ class PeriodManager:
             return None
 
         try:
-            if team.lower() == 'home':
+            if team == TeamSide.HOME:
                 period.increment_home_goals()
-            elif team.lower() == 'away':
+            elif team == TeamSide.AWAY:
                 period.increment_away_goals()
             else:
-                raise ValueError(f"Invalid team: {team}. Must be 'home' or 'away'")
+                raise ValueError(f"Invalid team: {team}. Must be TeamSide.HOME or TeamSide.AWAY")
             
             db.session.commit()
             
             if auto_sync:
                 period.sync_to_game()
             
-            logger.info(f"Incremented {team} goal in period {period_id}")
+            logger.info(f"Incremented {team.name} goal in period {period_id}")
             return period
 
         except Exception as e:
@@ -451,13 +481,13 @@ class PeriodManager:
             logger.error(f"Error incrementing goal: {e}")
             return None
 
-    def increment_period_foul(self, period_id: int, team: str, auto_sync: bool = True) -> Optional[Period]:
+    def increment_period_foul(self, period_id: int, team: TeamSide, auto_sync: bool = True) -> Optional[Period]:
         """
         Increment foul for a team in a period
         
         Args:
             period_id: Period ID
-            team: 'home' or 'away'
+            team: TeamSide.HOME or TeamSide.AWAY (use TeamSide.parse() for strings)
             auto_sync: Automatically sync to Game (default: True)
         
         Returns:
@@ -469,19 +499,19 @@ class PeriodManager:
             return None
 
         try:
-            if team.lower() == 'home':
+            if team == TeamSide.HOME:
                 period.increment_home_fouls()
-            elif team.lower() == 'away':
+            elif team == TeamSide.AWAY:
                 period.increment_away_fouls()
             else:
-                raise ValueError(f"Invalid team: {team}. Must be 'home' or 'away'")
+                raise ValueError(f"Invalid team: {team}. Must be TeamSide.HOME or TeamSide.AWAY")
             
             db.session.commit()
             
             if auto_sync:
                 period.sync_to_game()
             
-            logger.info(f"Incremented {team} foul in period {period_id}")
+            logger.info(f"Incremented {team.name} foul in period {period_id}")
             return period
 
         except Exception as e:
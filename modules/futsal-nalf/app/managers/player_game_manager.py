@@ -1,6 +1,12 @@
 """PlayerGame Manager - handles player assignments to games"""
 from typing import List, Optional
 from app.extensions import db
+from app.utils.transactions import commit, rollback
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import insert, literal, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import selectinload
 from app.models.player_game import PlayerGame
 from app.models.player import Player
 from app.models.game import Game
@@ -8,6 +14,12 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Dialects supporting INSERT ... ON CONFLICT DO NOTHING
+_UPSERT_INSERTS = {
+    'postgresql': postgresql_insert,
+    'sqlite': sqlite_insert,
+}
+
 
 class PlayerGameManager:
     """Manager for PlayerGame operations"""
@@ -37,21 +49,18 @@ class PlayerGameManager:
         Raises:
             ValueError if player/game not found or player already assigned
         """
-        # Validate player exists
-        player = Player.query.get(player_id)
+        # Existence is checked here because SQLite does not enforce the FKs
+        player = db.session.execute(
+            select(Player.team_id, Player.is_goalkeeper, Player.is_captain, Player.number)
+            .where(Player.id == player_id)
+        ).first()
         if not player:
             raise ValueError(f"Zawodnik o ID {player_id} nie istnieje")
 
-        # Validate game exists
-        game = Game.query.get(game_id)
-        if not game:
+        # Session.get() answers from the identity map when the game is loaded
+        if db.session.get(Game, game_id) is None:
             raise ValueError(f"Mecz o ID {game_id} nie istnieje")
 
-        # Check if player already assigned
-        existing = PlayerGame.query.filter_by(player_id=player_id, game_id=game_id).first()
-        if existing:
-            raise ValueError(f"Zawodnik {player.full_name} jest już przypisany do meczu {game_id}")
-
         try:
             # Create snapshot (use overrides if provided, else copy from player)
             player_game = PlayerGame(
@@ -63,14 +72,25 @@ class PlayerGameManager:
                 number=override_number if override_number is not None else player.number
             )
             db.session.add(player_game)
-            db.session.commit()
+            commit()
 
-            logger.info(f"Assigned player {player.full_name} to game {game_id}")
+            logger.info("Assigned player %s to game %s", player_id, game_id)
             return player_game
 
+        except IntegrityError as e:
+            rollback()
+            # UNIQUE(player_id, game_id) - the player is already assigned
+            already_assigned = db.session.scalar(
+                select(PlayerGame.id).where(PlayerGame.player_id == player_id, PlayerGame.game_id == game_id)
+            )
+            if already_assigned is not None:
+                raise ValueError(f"Zawodnik o ID {player_id} jest już przypisany do meczu {game_id}")
+            logger.error("IntegrityError assigning player to game: %s", e)
+            raise
+
         except Exception as e:
-            db.session.rollback()
-            logger.error(f"Error assigning player to game: {e}")
+            rollback()
+            logger.error("Error assigning player to game: %s", e)
             raise
 
     def assign_team_to_game(self, team_id: int, game_id: int) -> List[PlayerGame]:
@@ -85,19 +105,45 @@ class PlayerGameManager:
 
         Returns:
             List of created PlayerGame objects
+
+        Raises:
+            ValueError if game not found
         """
-        players = Player.query.filter_by(team_id=team_id).all()
-        
-        assigned = []
-        for player in players:
-            try:
-                pg = self.assign_player_to_game(player.id, game_id)
-                assigned.append(pg)
-            except ValueError as e:
-                logger.warning(f"Skipping player {player.id}: {e}")
-                continue
-
-        logger.info(f"Assigned {len(assigned)} players from team {team_id} to game {game_id}")
+        # Validate game once for the whole team
+        game = db.session.get(Game, game_id)
+        if not game:
+            raise ValueError(f"Mecz o ID {game_id} nie istnieje")
+
+        # Copy the roster into player_games in one INSERT ... SELECT,
+        # skipping players already assigned to this game
+        columns = ['player_id', 'game_id', 'team_id', 'is_goalkeeper', 'is_captain', 'number']
+        roster = select(
+            Player.id, literal(game_id), Player.team_id,
+            Player.is_goalkeeper, Player.is_captain, Player.number
+        ).where(Player.team_id == team_id)
+
+        dialect_insert = _UPSERT_INSERTS.get(db.session.get_bind().dialect.name)
+        if dialect_insert is not None:
+            # Duplicates are skipped by the unique (player_id, game_id) index
+            stmt = dialect_insert(PlayerGame).from_select(columns, roster).on_conflict_do_nothing(
+                index_elements=['player_id', 'game_id']
+            )
+        else:
+            already_assigned = select(PlayerGame.player_id).where(PlayerGame.game_id == game_id)
+            stmt = insert(PlayerGame).from_select(
+                columns, roster.where(Player.id.not_in(already_assigned))
+            )
+        stmt = stmt.returning(PlayerGame)
+
+        try:
+            assigned = db.session.scalars(stmt).all()
+            commit()
+        except Exception as e:
+            rollback()
+            logger.error("Error assigning team to game: %s", e)
+            raise
+
+        logger.info("Assigned %s players from team %s to game %s", len(assigned), team_id, game_id)
         return assigned
 
     def get_players_for_game(self, game_id: int, team_id: int = None) -> List[PlayerGame]:
@@ -109,9 +155,12 @@ class PlayerGameManager:
             team_id: Optional filter by team
 
         Returns:
-            List of PlayerGame objects
+            List of PlayerGame objects (player and team eager-loaded)
         """
-        query = PlayerGame.query.filter_by(game_id=game_id)
+        query = PlayerGame.query.options(
+            selectinload(PlayerGame.player),
+            selectinload(PlayerGame.team)
+        ).filter_by(game_id=game_id)
         if team_id:
             query = query.filter_by(team_id=team_id)
         return query.order_by(
@@ -119,8 +168,8 @@ class PlayerGameManager:
         ).all()
 
     def get_player_game_by_id(self, player_game_id: int) -> Optional[PlayerGame]:
-        """Get PlayerGame by ID"""
-        return PlayerGame.query.get(player_game_id)
+        """Get PlayerGame by ID (identity-map hit on repeated calls within a request)"""
+        return db.session.get(PlayerGame, player_game_id)
 
     def update_player_game(self, player_game_id: int,
                           team_id: int = None,
@@ -144,26 +193,34 @@ class PlayerGameManager:
         """
         player_game = self.get_player_game_by_id(player_game_id)
         if not player_game:
-            logger.warning(f"PlayerGame with ID {player_game_id} not found")
+            logger.warning("PlayerGame with ID %s not found", player_game_id)
             return None
 
         try:
-            if team_id is not None:
+            changed = False
+            if team_id is not None and player_game.team_id != team_id:
                 player_game.team_id = team_id
-            if is_goalkeeper is not None:
+                changed = True
+            if is_goalkeeper is not None and player_game.is_goalkeeper != is_goalkeeper:
                 player_game.is_goalkeeper = is_goalkeeper
-            if is_captain is not None:
+                changed = True
+            if is_captain is not None and player_game.is_captain != is_captain:
                 player_game.is_captain = is_captain
-            if number is not None:
+                changed = True
+            if number is not None and player_game.number != number:
                 player_game.number = number
+                changed = True
+
+            if not changed:
+                return player_game
 
-            db.session.commit()
-            logger.info(f"Updated PlayerGame ID {player_game_id}")
+            commit()
+            logger.info("Updated PlayerGame ID %s", player_game_id)
             return player_game
 
         except Exception as e:
-            db.session.rollback()
-            logger.error(f"Error updating player game: {e}")
+            rollback()
+            logger.error("Error updating player game: %s", e)
             return None
 
     def remove_player_from_game(self, player_game_id: int) -> bool:
@@ -178,18 +235,18 @@ class PlayerGameManager:
         """
         player_game = self.get_player_game_by_id(player_game_id)
         if not player_game:
-            logger.warning(f"PlayerGame with ID {player_game_id} not found")
+            logger.warning("PlayerGame with ID %s not found", player_game_id)
             return False
 
         try:
             db.session.delete(player_game)
-            db.session.commit()
-            logger.info(f"Removed player from game (PlayerGame ID: {player_game_id})")
+            commit()
+            logger.info("Removed player from game (PlayerGame ID: %s)", player_game_id)
             return True
 
         except Exception as e:
-            db.session.rollback()
-            logger.error(f"Error removing player from game: {e}")
+            rollback()
+            logger.error("Error removing player from game: %s", e)
             return False
 
     def get_games_for_player(self, player_id: int) -> List[PlayerGame]:
@@ -1,6 +1,9 @@
 """Player Manager - handles CRUD operations for Player model"""
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from app.extensions import db
+from app.utils.transactions import commit, rollback
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 from app.models.player import Player
 from app.models.team import Team
 import logging
@@ -32,9 +35,9 @@ class PlayerManager:
         Raises:
             ValueError if team not found
         """
-        # Validate team exists
-        team = Team.query.get(team_id)
-        if not team:
+        # Validate team exists (only the name is needed, for the log line)
+        team_name = db.session.scalar(select(Team.name).where(Team.id == team_id))
+        if team_name is None:
             raise ValueError(f"Zespół o ID {team_id} nie istnieje")
 
         try:
@@ -48,20 +51,35 @@ class PlayerManager:
                 foreign_id=foreign_id
             )
             db.session.add(player)
-            db.session.commit()
+            commit()
 
-            logger.info(f"Created player: {player.full_name} (Team: {team.name})")
+            logger.info("Created player: %s %s (Team: %s)", first_name, last_name, team_name)
             return player
 
         except Exception as e:
-            db.session.rollback()
-            logger.error(f"Error creating player: {e}")
+            rollback()
+            logger.error("Error creating player: %s", e)
             raise
 
     def get_all_players(self) -> List[Player]:
         """Get all players"""
         return Player.query.order_by(Player.last_name, Player.first_name).all()
 
+    def iter_all_players(self, batch_size: int = 500) -> Iterator[Player]:
+        """
+        Stream all players in batches instead of materializing the full list
+
+        Team is loaded per batch with selectinload, so reading player.team
+        while iterating does not issue a query per row.
+        """
+        stmt = (
+            select(Player)
+            .options(selectinload(Player.team))
+            .order_by(Player.last_name, Player.first_name)
+            .execution_options(yield_per=batch_size)
+        )
+        return iter(db.session.execute(stmt).scalars())
+
     def get_players_by_team(self, team_id: int) -> List[Player]:
         """Get all players for a specific team"""
         return Player.query.filter_by(team_id=team_id).order_by(
@@ -71,8 +89,13 @@ class PlayerManager:
         ).all()
 
     def get_player_by_id(self, player_id: int) -> Optional[Player]:
-        """Get player by ID"""
-        return Player.query.get(player_id)
+        """
+        Get player by ID
+
+        Session.get() answers from the request-scoped identity map, so repeated
+        lookups of the same player within one request don't query again.
+        """
+        return db.session.get(Player, player_id)
 
     def get_player_by_foreign_id(self, foreign_id: str) -> Optional[Player]:
         """Get player by foreign ID"""
@@ -103,35 +126,46 @@ class PlayerManager:
         """
         player = self.get_player_by_id(player_id)
         if not player:
-            logger.warning(f"Player with ID {player_id} not found")
+            logger.warning("Player with ID %s not found", player_id)
             return None
 
         try:
-            if first_name is not None:
+            changed = False
+            if first_name is not None and player.first_name != first_name:
                 player.first_name = first_name
-            if last_name is not None:
+                changed = True
+            if last_name is not None and player.last_name != last_name:
                 player.last_name = last_name
-            if team_id is not None:
-                team = Team.query.get(team_id)
-                if not team:
+                changed = True
+            if team_id is not None and player.team_id != team_id:
+                # SQLite does not enforce the FK, so check the team exists
+                if db.session.scalar(select(Team.id).where(Team.id == team_id)) is None:
                     raise ValueError(f"Zespół o ID {team_id} nie istnieje")
                 player.team_id = team_id
-            if number is not None:
+                changed = True
+            if number is not None and player.number != number:
                 player.number = number
-            if is_goalkeeper is not None:
+                changed = True
+            if is_goalkeeper is not None and player.is_goalkeeper != is_goalkeeper:
                 player.is_goalkeeper = is_goalkeeper
-            if is_captain is not None:
+                changed = True
+            if is_captain is not None and player.is_captain != is_captain:
                 player.is_captain = is_captain
-            if foreign_id is not None:
+                changed = True
+            if foreign_id is not None and player.foreign_id != foreign_id:
                 player.foreign_id = foreign_id
+                changed = True
+
+            if not changed:
+                return player
 
-            db.session.commit()
-            logger.info(f"Updated player ID {player_id}")
+            commit()
+            logger.info("Updated player ID %s", player_id)
             return player
 
         except Exception as e:
-            db.session.rollback()
-            logger.error(f"Error updating player: {e}")
+            rollback()
+            logger.error("Error updating player: %s", e)
             raise
 
     def delete_player(self, player_id: int) -> bool:
@@ -148,19 +182,19 @@ class PlayerManager:
         """
         player = self.get_player_by_id(player_id)
         if not player:
-            logger.warning(f"Player with ID {player_id} not found")
+            logger.warning("Player with ID %s not found", player_id)
             return False
 
         try:
             player_name = player.full_name
             db.session.delete(player)
-            db.session.commit()
-            logger.info(f"Deleted player: {player_name}")
+            commit()
+            logger.info("Deleted player: %s", player_name)
             return True
 
         except Exception as e:
-            db.session.rollback()
-            logger.error(f"Error deleting player: {e}")
+            rollback()
+            logger.error("Error deleting player: %s", e)
             return False
 
     def get_goalkeepers(self, team_id: int = None) -> List[Player]:
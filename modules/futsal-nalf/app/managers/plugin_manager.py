@@ -24,6 +24,7 @@
 #     def __init__(self):
 #         """Initialize Plugin Manager (metadata only)"""
 #         self._plugins_cache = []
+#         self._plugins_by_id = {}
 #         current_app.logger.info("PluginManager initialized (metadata only - HUB manages processes)")
 #
 #     def load_plugins(self):
@@ -35,6 +36,7 @@
 #         """
 #         # self._plugins_cache = Plugin.query.order_by(Plugin.startup_priority).all()
 #         self._plugins_cache = current_app.config['REQUIRED_PLUGINS']
+#         self._plugins_by_id = {plugin.id: plugin for plugin in self._plugins_cache}
 #
 #         current_app.logger.info(f"Loaded {len(self._plugins_cache)} plugins from database")
 #
@@ -85,10 +87,7 @@
 #         Returns:
 #             Plugin model or None
 #         """
-#         for plugin in self._plugins_cache:
-#             if plugin.id == plugin_id:
-#                 return plugin
-#         return None
+#         return self._plugins_by_id.get(plugin_id)
 #
 #     def mark_plugin_online(self, plugin_id):
 #         """
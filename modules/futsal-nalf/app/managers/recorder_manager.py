@@ -1,7 +1,15 @@
 """Recorder Manager - Manages camera recording"""
 from flask import current_app
+from sqlalchemy import select
+import logging
+import queue
+import threading
+from app.extensions import db
 from app.models import Camera
 
+logger = logging.getLogger(__name__)
+
+
 class RecorderManager:
     """Manages recorder plugin and camera recording"""
     
@@ -9,6 +17,10 @@ class RecorderManager:
         self.hub_client = hub_client
         self.is_recording = False
         self.recorder_plugin_id = 'recorder'
+        self._cameras_cache = None
+        self._send_queue = queue.Queue()
+        self._sender_thread = None
+        self._sender_lock = threading.Lock()
         
     def on_recorder_online(self):
         """Called when recorder plugin comes online"""
@@ -18,8 +30,7 @@ class RecorderManager:
         cameras = self._get_enabled_cameras()
         
         # Send configuration to recorder
-        self.hub_client.send_to_plugin(
-            self.recorder_plugin_id,
+        self._send(
             'configure_cameras',
             {
                 'cameras': cameras
@@ -29,7 +40,7 @@ class RecorderManager:
         # Check if we should be recording (based on OBS status)
         # TODO: Query OBS status and sync
         # For now, just log
-        current_app.logger.info(f"Recorder configured with {len(cameras)} cameras")
+        current_app.logger.info("Recorder configured with %s cameras", len(cameras))
     
     def start_recording(self):
         """Start camera recording"""
@@ -39,11 +50,10 @@ class RecorderManager:
         
         cameras = self._get_enabled_cameras()
         
-        current_app.logger.info(f"🔴 Starting recording for {len(cameras)} cameras")
+        current_app.logger.info("🔴 Starting recording for %s cameras", len(cameras))
         
         # Send to recorder plugin
-        self.hub_client.send_to_plugin(
-            self.recorder_plugin_id,
+        self._send(
             'start_recording',
             {
                 'cameras': cameras
@@ -66,8 +76,7 @@ class RecorderManager:
         current_app.logger.info("⏹️  Stopping recording")
         
         # Send to recorder plugin
-        self.hub_client.send_to_plugin(
-            self.recorder_plugin_id,
+        self._send(
             'stop_recording',
             {}
         )
@@ -81,11 +90,10 @@ class RecorderManager:
         if not self.is_recording:
             return {'error': 'Not recording'}
         
-        current_app.logger.info(f"📍 Adding marker: {marker_type}")
+        current_app.logger.info("📍 Adding marker: %s", marker_type)
         
         # Send to recorder plugin
-        self.hub_client.send_to_plugin(
-            self.recorder_plugin_id,
+        self._send(
             'add_marker',
             {
                 'marker_type': marker_type,
@@ -95,10 +103,43 @@ class RecorderManager:
         
         return {'status': 'marker_added', 'type': marker_type}
     
+    def _send(self, msg_type, payload):
+        """Queue message for recorder plugin - sent from background thread, not the request thread"""
+        # Lock so concurrent first sends start a single worker (keeps order)
+        with self._sender_lock:
+            if self._sender_thread is None:
+                self._sender_thread = threading.Thread(target=self._send_worker, daemon=True)
+                self._sender_thread.start()
+        self._send_queue.put((msg_type, payload))
+
+    def _send_worker(self):
+        """Drain send queue in order (RUNS IN SENDER THREAD)"""
+        while True:
+            msg_type, payload = self._send_queue.get()
+            try:
+                self.hub_client.send_to_plugin(self.recorder_plugin_id, msg_type, payload)
+            except Exception as e:
+                logger.error("Failed to send %s to recorder: %s", msg_type, e)
+            finally:
+                self._send_queue.task_done()
+
     def _get_enabled_cameras(self):
-        """Get list of enabled camera IDs"""
-        cameras = Camera.query.filter_by(is_enabled=True).order_by(Camera.priority).all()
-        return [cam.recorder_camera_id for cam in cameras if cam.recorder_camera_id]
+        """
+        Get list of enabled camera IDs (single-column SELECT, no ORM hydration)
+
+        Result is cached on the instance until invalidate_camera_cache() is called
+        """
+        if self._cameras_cache is None:
+            self._cameras_cache = db.session.execute(
+                select(Camera.recorder_camera_id)
+                .where(Camera.is_enabled == True, Camera.recorder_camera_id.isnot(None))  # noqa: E712
+                .order_by(Camera.priority)
+            ).scalars().all()
+        return list(self._cameras_cache)
+
+    def invalidate_camera_cache(self):
+        """Drop cached enabled-cameras list (call after Camera changes)"""
+        self._cameras_cache = None
     
     def get_camera_status(self):
         """Get recording status"""
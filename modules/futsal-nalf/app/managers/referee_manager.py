@@ -1,6 +1,8 @@
 """Referee Manager - handles CRUD operations for Referee model"""
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from app.extensions import db
+from app.utils.transactions import commit, rollback
+from sqlalchemy import select
 from app.models.referee import Referee
 import logging
 
@@ -27,23 +29,32 @@ class RefereeManager:
                 last_name=last_name
             )
             db.session.add(referee)
-            db.session.commit()
+            commit()
 
-            logger.info(f"Created referee: {referee.full_name}")
+            logger.info("Created referee: %s %s", first_name, last_name)
             return referee
 
         except Exception as e:
-            db.session.rollback()
-            logger.error(f"Error creating referee: {e}")
+            rollback()
+            logger.error("Error creating referee: %s", e)
             return None
 
     def get_all_referees(self) -> List[Referee]:
         """Get all referees"""
         return Referee.query.order_by(Referee.last_name, Referee.first_name).all()
 
+    def iter_all_referees(self, batch_size: int = 500) -> Iterator[Referee]:
+        """Stream all referees in batches instead of materializing the full list"""
+        stmt = (
+            select(Referee)
+            .order_by(Referee.last_name, Referee.first_name)
+            .execution_options(yield_per=batch_size)
+        )
+        return iter(db.session.execute(stmt).scalars())
+
     def get_referee_by_id(self, referee_id: int) -> Optional[Referee]:
-        """Get referee by ID"""
-        return Referee.query.get(referee_id)
+        """Get referee by ID (identity-map hit on repeated calls within a request)"""
+        return db.session.get(Referee, referee_id)
 
     def update_referee(self, referee_id: int, first_name: str = None,
                       last_name: str = None) -> Optional[Referee]:
@@ -60,22 +71,28 @@ class RefereeManager:
         """
         referee = self.get_referee_by_id(referee_id)
         if not referee:
-            logger.warning(f"Referee with ID {referee_id} not found")
+            logger.warning("Referee with ID %s not found", referee_id)
             return None
 
         try:
-            if first_name is not None:
+            changed = False
+            if first_name is not None and referee.first_name != first_name:
                 referee.first_name = first_name
-            if last_name is not None:
+                changed = True
+            if last_name is not None and referee.last_name != last_name:
                 referee.last_name = last_name
+                changed = True
+
+            if not changed:
+                return referee
 
-            db.session.commit()
-            logger.info(f"Updated referee ID {referee_id}")
+            commit()
+            logger.info("Updated referee ID %s", referee_id)
             return referee
 
         except Exception as e:
-            db.session.rollback()
-            logger.error(f"Error updating referee: {e}")
+            rollback()
+            logger.error("Error updating referee: %s", e)
             return None
 
     def delete_referee(self, referee_id: int) -> bool:
@@ -92,17 +109,17 @@ class RefereeManager:
         """
         referee = self.get_referee_by_id(referee_id)
         if not referee:
-            logger.warning(f"Referee with ID {referee_id} not found")
+            logger.warning("Referee with ID %s not found", referee_id)
             return False
 
         try:
             referee_name = referee.full_name
             db.session.delete(referee)
-            db.session.commit()
-            logger.info(f"Deleted referee: {referee_name}")
+            commit()
+            logger.info("Deleted referee: %s", referee_name)
             return True
 
         except Exception as e:
-            db.session.rollback()
-            logger.error(f"Error deleting referee: {e}")
+            rollback()
+            logger.error("Error deleting referee: %s", e)
             return False
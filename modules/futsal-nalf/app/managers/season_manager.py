@@ -3,7 +3,10 @@ from app.extensions import db
 from app.models.season import Season
 from app.models.league import League
 from app.models.game import Game
+from app.models.league_team import LeagueTeam
+from sqlalchemy import case, distinct, exists, func, select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,9 +19,19 @@ class SeasonManager:
         """Get all seasons ordered by number (newest first)"""
         return Season.query.order_by(Season.number.desc()).all()
 
+    def get_all_seasons_lite(self):
+        """
+        Get id/number/name of all seasons as lightweight rows (newest first)
+
+        For season pickers; skips ORM object construction.
+        """
+        return db.session.execute(
+            select(Season.id, Season.number, Season.name).order_by(Season.number.desc())
+        ).all()
+
     def get_season_by_id(self, season_id):
         """Get season by ID"""
-        return Season.query.get(season_id)
+        return db.session.get(Season, season_id)
 
     def get_season_by_number(self, number):
         """Get season by number"""
@@ -39,16 +52,6 @@ class SeasonManager:
         Raises:
             ValueError if season with this number or name already exists
         """
-        # Check if season with this number already exists
-        existing_number = self.get_season_by_number(number)
-        if existing_number:
-            raise ValueError(f"Sezon o numerze {number} już istnieje")
-
-        # Check if season with this name already exists
-        existing_name = Season.query.filter_by(name=name).first()
-        if existing_name:
-            raise ValueError(f"Sezon o nazwie '{name}' już istnieje")
-
         try:
             season = Season(
                 number=number,
@@ -62,8 +65,14 @@ class SeasonManager:
             return season
 
         except IntegrityError as e:
+            # Uniqueness is enforced by the DB; map the violated column to a message
             db.session.rollback()
             logger.error(f"IntegrityError creating season: {e}")
+            error = str(e.orig).lower()
+            if 'seasons.number' in error or 'seasons_number' in error or '(number)' in error:
+                raise ValueError(f"Sezon o numerze {number} już istnieje")
+            if 'seasons.name' in error or 'seasons_name' in error or '(name)' in error:
+                raise ValueError(f"Sezon o nazwie '{name}' już istnieje")
             raise ValueError("Nie można utworzyć sezonu - naruszenie unikalności danych")
 
         except Exception as e:
@@ -95,22 +104,20 @@ class SeasonManager:
             # Update number if provided
             if number is not None and number != season.number:
                 # Check if new number is unique
-                existing = Season.query.filter(
+                if db.session.query(exists().where(
                     Season.number == number,
                     Season.id != season_id
-                ).first()
-                if existing:
+                )).scalar():
                     raise ValueError(f"Sezon o numerze {number} już istnieje")
                 season.number = number
 
             # Update name if provided
             if name is not None and name != season.name:
                 # Check if new name is unique
-                existing = Season.query.filter(
+                if db.session.query(exists().where(
                     Season.name == name,
                     Season.id != season_id
-                ).first()
-                if existing:
+                )).scalar():
                     raise ValueError(f"Sezon o nazwie '{name}' już istnieje")
                 season.name = name
 
@@ -150,9 +157,13 @@ class SeasonManager:
             raise ValueError(f"Nie znaleziono sezonu o ID {season_id}")
 
         try:
-            # Get stats before deletion for logging
-            leagues_count = season.total_leagues
-            games_count = season.total_games
+            # Get stats before deletion for logging (one aggregate query)
+            leagues_count, games_count = db.session.query(
+                func.count(distinct(League.id)),
+                func.count(Game.id)
+            ).select_from(League).outerjoin(Game).filter(
+                League.season_id == season_id
+            ).one()
 
             db.session.delete(season)
             db.session.commit()
@@ -166,12 +177,14 @@ class SeasonManager:
             logger.error(f"Error deleting season: {e}")
             return False
 
-    def get_season_statistics(self, season_id):
+    def get_season_statistics(self, season_id, include_leagues=True):
         """
         Get detailed statistics for a season
 
         Args:
             season_id: Season ID
+            include_leagues: Include per-league dicts; pass False for
+                dashboards that only need the counters
 
         Returns:
             Dictionary with season statistics or None if season not found
@@ -180,31 +193,34 @@ class SeasonManager:
         if not season:
             return None
 
-        leagues = season.leagues.all()
-        total_games = season.total_games
-        finished_games = Game.query.join(League).filter(
-            League.season_id == season_id,
-            Game.status == Game.STATUS_FINISHED
-        ).count()
-        live_games = Game.query.join(League).filter(
-            League.season_id == season_id,
-            Game.status == Game.STATUS_PENDING
-        ).count()
-        upcoming_games = Game.query.join(League).filter(
-            League.season_id == season_id,
-            Game.status == Game.STATUS_NOT_STARTED
-        ).count()
-
-        # Get unique teams playing in this season
-        from app.models.league_team import LeagueTeam
-        teams_count = db.session.query(LeagueTeam.team_id).join(League).filter(
+        # One round-trip for all game counters (conditional aggregation), the
+        # league count and the unique teams count (subqueries use an aliased
+        # League so they are not correlated to the join; both are served by
+        # the leagues.season_id and uix_league_team indexes)
+        season_league = aliased(League)
+        leagues_subq = select(func.count(season_league.id)).where(
+            season_league.season_id == season_id
+        ).scalar_subquery()
+        teams_subq = select(func.count(distinct(LeagueTeam.team_id))).join(
+            season_league, LeagueTeam.league_id == season_league.id
+        ).where(
+            season_league.season_id == season_id
+        ).scalar_subquery()
+        (finished_games, live_games, upcoming_games, total_games,
+         total_leagues, teams_count) = db.session.query(
+            func.count(case((Game.status == Game.STATUS_FINISHED, 1))),
+            func.count(case((Game.status == Game.STATUS_PENDING, 1))),
+            func.count(case((Game.status == Game.STATUS_NOT_STARTED, 1))),
+            func.count(Game.id),
+            leagues_subq,
+            teams_subq
+        ).select_from(Game).join(League).filter(
             League.season_id == season_id
-        ).distinct().count()
+        ).one()
 
-        return {
-            'season': season.to_dict(),
-            'leagues': [league.to_dict() for league in leagues],
-            'total_leagues': len(leagues),
+        stats = {
+            'season': season.to_dict(total_leagues=total_leagues, total_games=total_games),
+            'total_leagues': total_leagues,
             'total_teams': teams_count,
             'total_games': total_games,
             'finished_games': finished_games,
@@ -212,6 +228,27 @@ class SeasonManager:
             'upcoming_games': upcoming_games
         }
 
+        if include_leagues:
+            # Leagues with their team/game counts in one query; to_dict() would
+            # otherwise load each league's teams and COUNT its games
+            teams_subq = select(func.count(LeagueTeam.id)).where(
+                LeagueTeam.league_id == League.id
+            ).correlate(League).scalar_subquery()
+            games_subq = select(func.count(Game.id)).where(
+                Game.league_id == League.id
+            ).correlate(League).scalar_subquery()
+            leagues = db.session.execute(
+                select(League, teams_subq, games_subq)
+                .where(League.season_id == season_id)
+                .order_by(League.id)
+            ).all()
+            stats['leagues'] = [
+                league.to_dict(total_teams=league_teams, total_games=league_games)
+                for league, league_teams, league_games in leagues
+            ]
+
+        return stats
+
     def get_current_season(self):
         """
         Get the latest (current) season based on highest season number
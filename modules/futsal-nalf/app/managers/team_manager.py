@@ -3,12 +3,51 @@ from typing import List, Dict, Optional, Callable
 from flask import session, current_app
 from app.extensions import db
 from app.models.team import Team
+from sqlalchemy import select
 import threading
 import logging
 import os
 
 logger = logging.getLogger(__name__)
 
+ALLOWED_LOGO_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp')
+
+# Logo listing cached by directory mtime (adding/removing a file bumps it)
+_logos_cache = {'dir': None, 'mtime': None, 'data': []}
+
+
+def get_all_logos():
+    """
+    Get logo files available in static/images/logos
+
+    The listing is rescanned only when the directory mtime changes,
+    so repeated calls cost a single os.stat().
+
+    Returns:
+        List of dicts with 'filename' and 'path' keys
+    """
+    logos_dir = os.path.join(current_app.static_folder, 'images', 'logos')
+    try:
+        mtime = os.stat(logos_dir).st_mtime
+    except OSError:
+        return []
+
+    if _logos_cache['dir'] == logos_dir and _logos_cache['mtime'] == mtime:
+        return _logos_cache['data']
+
+    logos = []
+    with os.scandir(logos_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.lower().endswith(ALLOWED_LOGO_EXTENSIONS) and entry.is_file():
+                logos.append({
+                    'filename': name,
+                    'path': f'/static/images/logos/{name}'
+                })
+
+    _logos_cache.update(dir=logos_dir, mtime=mtime, data=logos)
+    return logos
+
 
 class TeamManager:
     """Manager for Team CRUD operations and scraping workflow"""
@@ -19,34 +58,40 @@ class TeamManager:
     def __init__(self):
         # self._scraping_thread = None
         # self._scraping_lock = threading.Lock()
-        self.logos = self.get_all_logos()
+        pass
+    
+    @property
+    def logos(self):
+        """Logo files, read on access so the manager can be built without an app context"""
+        return get_all_logos()
     
     # =========================
     # CRUD Operations
     # =========================
 
     def get_all_logos(self):
-        logos_dir = os.path.join(current_app.static_folder, 'images', 'logos')
-        logos = []
-
-        if os.path.exists(logos_dir):
-            allowed_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp'}
-            for file in os.listdir(logos_dir):
-                print(f'file: {file}')
-                if any(file.lower().endswith(ext) for ext in allowed_extensions):
-                    logos.append({
-                        'filename': file,
-                        'path': f'/static/images/logos/{file}'
-                    })
-        return logos
+        """Get logo files available in static/images/logos"""
+        return get_all_logos()
     
     def get_all_teams(self) -> List[Team]:
         """Get all teams from database"""
         return Team.query.order_by(Team.name).all()
     
+    def get_all_teams_lite(self):
+        """
+        Get id/name/short_name of all teams as lightweight rows
+
+        For read-only lists such as dropdowns; skips ORM object
+        construction and identity-map registration. Use get_all_teams()
+        when full Team objects are needed.
+        """
+        return db.session.execute(
+            select(Team.id, Team.name, Team.short_name).order_by(Team.name)
+        ).all()
+    
     def get_team_by_id(self, team_id: int) -> Optional[Team]:
         """Get team by ID"""
-        return Team.query.get(team_id)
+        return db.session.get(Team, team_id)
     
     def get_team_by_url(self, team_url: str) -> Optional[Team]:
         """Get team by team_url (unique identifier)"""
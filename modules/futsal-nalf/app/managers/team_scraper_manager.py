@@ -7,20 +7,55 @@ from app.managers.team_manager import TeamManager
 import threading
 import logging
 import os
+import time
+import uuid
 
 logger = logging.getLogger(__name__)
 
 team_manager = TeamManager()
 
+# Pending teams are kept server-side, keyed by a per-browser token stored in
+# the session cookie, so the cookie no longer carries the whole scraped list.
+# Each entry is (stored_at, {team_url: team data}) for O(1) lookup and
+# removal. Abandoned sessions are pruned on write: entries older than
+# PENDING_TEAMS_TTL, and the oldest ones beyond PENDING_TEAMS_MAX_SESSIONS.
+PENDING_TEAMS_TTL = 24 * 60 * 60  # seconds
+PENDING_TEAMS_MAX_SESSIONS = 64
+
+_pending_teams_store = {}
+_pending_teams_lock = threading.Lock()
+
+
+def _pending_teams(token):
+    """Get pending teams dict of a token (call with _pending_teams_lock held)"""
+    entry = _pending_teams_store.get(token)
+    return entry[1] if entry is not None else {}
+
+
+def _store_pending_teams(token, teams):
+    """Store pending teams of a token and prune stale entries (lock held)"""
+    now = time.monotonic()
+    _pending_teams_store.pop(token, None)
+    for stale in [t for t, (stored_at, _) in _pending_teams_store.items()
+                  if now - stored_at > PENDING_TEAMS_TTL]:
+        del _pending_teams_store[stale]
+    # Dicts keep insertion order, so the first keys are the oldest
+    while len(_pending_teams_store) >= PENDING_TEAMS_MAX_SESSIONS:
+        del _pending_teams_store[next(iter(_pending_teams_store))]
+    _pending_teams_store[token] = (now, teams)
+
 class TeamScraperManager:
     """Manager for Team CRUD operations and scraping workflow"""
     
-    SCRAPED_TEAMS_SESSION_KEY = 'scraped_teams'
+    SCRAPED_TEAMS_SESSION_KEY = 'scraped_teams_token'
     SCRAPING_STATUS_KEY = 'scraping_status'
     
     def __init__(self):
         self._scraping_thread = None
         self._scraping_lock = threading.Lock()
+        # team_url -> team ID for known teams, filled by the last scrape;
+        # IDs (not Team objects) so entries survive the request session
+        self._team_id_by_url = {}
        
     # =========================
     # Scraping Workflow (Threaded)
@@ -167,32 +202,49 @@ class TeamScraperManager:
             Statistics dictionary
         """
         updated_count = 0
-        new_teams = []
+        new_teams = {}
+        renamed = []
+
+        # Prefetch all known teams in one query instead of one per scraped URL
+        urls = [t['team_url'] for t in scraped_teams]
+        existing = {
+            t.team_url: t
+            for t in Team.query.filter(Team.team_url.in_(urls)).all()
+        } if urls else {}
+        self._team_id_by_url = {url: team.id for url, team in existing.items()}
 
         for team_data in scraped_teams:
             team_url = team_data['team_url']
             team_name = team_data['name']
             
             # Check if team exists in database
-            existing_team = team_manager.get_team_by_url(team_url)
+            existing_team = existing.get(team_url)
             
             if existing_team:
                 # Team exists → ALWAYS update name (names can change)
                 if existing_team.name != team_name:
-                    old_name = existing_team.name
+                    renamed.append((existing_team.name, team_name))
                     existing_team.name = team_name
-                    db.session.commit()
                     updated_count += 1
-                    logger.info(f"Updated team name: '{old_name}' → '{team_name}'")
                 else:
                     logger.debug(f"Team name unchanged: {team_name}")
             else:
                 # Team is new → add to pending list
-                new_teams.append(team_data)
+                new_teams[team_url] = team_data
+
+        # Commit all name updates in one transaction instead of one per team
+        if renamed:
+            try:
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+            for old_name, team_name in renamed:
+                logger.info(f"Updated team name: '{old_name}' → '{team_name}'")
         
-        # Store new teams in session
-        session[self.SCRAPED_TEAMS_SESSION_KEY] = new_teams
-        session.modified = True
+        # Store new teams server-side
+        with _pending_teams_lock:
+            _store_pending_teams(self._pending_teams_token(create=True), new_teams)
         
         return {
             'total_scraped': len(scraped_teams),
@@ -200,15 +252,36 @@ class TeamScraperManager:
             'new_pending': len(new_teams)
         }
     
+    def _pending_teams_token(self, create: bool = False) -> Optional[str]:
+        """
+        Get the pending-teams store key for the current browser session
+        
+        Args:
+            create: Generate and save a new token if the session has none
+        
+        Returns:
+            Token string or None if not set and create is False
+        """
+        token = session.get(self.SCRAPED_TEAMS_SESSION_KEY)
+        if token is None and create:
+            token = uuid.uuid4().hex
+            session[self.SCRAPED_TEAMS_SESSION_KEY] = token
+            session.modified = True
+        return token
+    
     # def get_pending_teams(self) -> List[Dict[str, str]]:
     def get_pending_teams(self):
         """
         Get list of scraped teams pending completion
         
         Returns:
-            List of team dictionaries from session
+            List of team dictionaries from the server-side store
         """
-        return session.get(self.SCRAPED_TEAMS_SESSION_KEY, [])
+        token = self._pending_teams_token()
+        if token is None:
+            return []
+        with _pending_teams_lock:
+            return list(_pending_teams(token).values())
     
     def get_pending_team_by_url(self, team_url: str) -> Optional[Dict[str, str]]:
         """
@@ -220,15 +293,15 @@ class TeamScraperManager:
         Returns:
             Team dictionary or None if not found
         """
-        pending_teams = self.get_pending_teams()
-        for team in pending_teams:
-            if team['team_url'] == team_url:
-                return team
-        return None
+        token = self._pending_teams_token()
+        if token is None:
+            return None
+        with _pending_teams_lock:
+            return _pending_teams(token).get(team_url)
     
     def remove_pending_team(self, team_url: str) -> bool:
         """
-        Remove team from pending list in session
+        Remove team from pending list
         
         Args:
             team_url: Team URL to remove
@@ -236,20 +309,20 @@ class TeamScraperManager:
         Returns:
             True if removed, False if not found
         """
-        pending_teams = self.get_pending_teams()
-        updated_teams = [t for t in pending_teams if t['team_url'] != team_url]
-        
-        if len(updated_teams) < len(pending_teams):
-            session[self.SCRAPED_TEAMS_SESSION_KEY] = updated_teams
-            session.modified = True
-            return True
+        token = self._pending_teams_token()
+        if token is None:
+            return False
         
-        return False
+        with _pending_teams_lock:
+            return _pending_teams(token).pop(team_url, None) is not None
     
     def clear_pending_teams(self):
-        """Clear all pending teams from session"""
-        session.pop(self.SCRAPED_TEAMS_SESSION_KEY, None)
+        """Clear all pending teams"""
+        token = session.pop(self.SCRAPED_TEAMS_SESSION_KEY, None)
         session.modified = True
+        if token is not None:
+            with _pending_teams_lock:
+                _pending_teams_store.pop(token, None)
     
     def complete_team_from_scraping(self, team_url: str, name_20: str, 
                                    short_name: str, logo_path: str = None,
@@ -273,8 +346,17 @@ class TeamScraperManager:
             logger.warning(f"No pending team found with URL: {team_url}")
             return None
         
-        # Check if team already exists (safety check)
-        existing_team = team_manager.get_team_by_url(team_url)
+        # Check if team already exists (safety check); a cached ID resolves
+        # through the identity map, stale entries fall back to the DB
+        existing_team = None
+        team_id = self._team_id_by_url.get(team_url)
+        if team_id is not None:
+            existing_team = team_manager.get_team_by_id(team_id)
+            if existing_team is None or existing_team.team_url != team_url:
+                self._team_id_by_url.pop(team_url, None)
+                existing_team = None
+        if existing_team is None:
+            existing_team = team_manager.get_team_by_url(team_url)
         if existing_team:
             logger.warning(f"Team already exists: {existing_team.name}")
             self.remove_pending_team(team_url)
@@ -298,6 +380,8 @@ class TeamScraperManager:
             foreign_id=foreign_id
         )
         
+        self._team_id_by_url[team_url] = team.id
+        
         # Remove from pending list
         self.remove_pending_team(team_url)
         
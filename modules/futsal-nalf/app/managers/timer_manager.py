@@ -1,13 +1,216 @@
 """Timer Manager - Manages timer plugin communication and state"""
 from flask import current_app
-from datetime import datetime
+from contextlib import contextmanager
+from functools import partial
 # from app.managers import get_timer_manager
+import itertools
+import operator
+import sys
 import threading
+import time
+
+# Cached timer states (interned, so equal states share one object)
+STATE_IDLE = sys.intern('idle')
+STATE_RUNNING = sys.intern('running')
+STATE_PAUSED = sys.intern('paused')
+STATE_STOPPED = sys.intern('stopped')
+STATE_LIMIT_REACHED = sys.intern('limit_reached')
+STATE_DISCONNECTED = sys.intern('disconnected')
+STATE_UNKNOWN = sys.intern('unknown')
+
+# (timer_id, elapsed_time, state) from a timer state message payload
+_get_tick_fields = operator.itemgetter('timer_id', 'elapsed_time', 'state')
+
+# Fixed parts of create_timer payloads built by the high-level helpers;
+# copied per call, then the per-timer keys are filled in
+_MATCH_TEMPLATE = {
+    'timer_type': 'independent',
+    'pause_at_limit': False,
+    'update_interval_ms': 100,
+}
+_PENALTY_TEMPLATE = {
+    'timer_type': 'dependent',
+    'pause_at_limit': True,
+    'update_interval_ms': 1000,
+}
+_FAST_TEMPLATE = {  # Rafting / skiing
+    'timer_type': 'independent',
+    'update_interval_ms': 10,
+}
+
+# Timer limits in ms for the usual match/penalty durations (minutes)
+_DURATION_MS = {m: m * 60 * 1000 for m in (1, 2, 3, 4, 5, 10, 20, 40)}
+
+# timer_event name -> cached state
+_EVENT_STATES = {
+    'limit_reached': STATE_LIMIT_REACHED,
+    'paused': STATE_PAUSED,
+    'resumed': STATE_RUNNING,
+    'stopped': STATE_STOPPED,
+    'running': STATE_RUNNING,
+}
+
+
+class TimerState:
+    """
+    Cached state of one timer
+
+    Slotted replacement for the per-timer dict. Fields that were never
+    set stay unset, so get() behaves like dict.get() for existing callers;
+    keys outside the known fields land in a lazily created extra dict.
+    """
+    __slots__ = (
+        'timer_id', 'timer_type', 'state', 'initial_time', 'elapsed_time',
+        'metadata', 'parent_id', 'limit_time', 'last_update', 'extra',
+    )
+    FIELDS = frozenset(__slots__) - {'extra'}
+
+    def __init__(self, timer_id, **fields):
+        self.timer_id = timer_id
+        if fields:
+            self.update(fields)
+
+    def update(self, fields):
+        """Set fields from a dict; unknown keys go to extra"""
+        for key, value in fields.items():
+            if key in self.FIELDS:
+                setattr(self, key, value)
+            else:
+                try:
+                    self.extra[key] = value
+                except AttributeError:
+                    self.extra = {key: value}
+
+    def get(self, key, default=None):
+        """Get a field like dict.get()"""
+        if key in self.FIELDS:
+            return getattr(self, key, default)
+        return getattr(self, 'extra', {}).get(key, default)
+
+    def to_dict(self):
+        """Serialize set fields (and extra keys) into a plain dict"""
+        data = {}
+        for key in self.__slots__:
+            try:
+                value = getattr(self, key)
+            except AttributeError:
+                continue
+            if key == 'extra':
+                data.update(value)
+            else:
+                data[key] = value
+        return data
+
+
+class ShardedTimerStore:
+    """
+    Timer state cache split into lock-striped shards
+
+    Each timer_id maps to one shard by hash, so handlers updating
+    different timers take different locks instead of one global lock.
+    Shard locks are plain (non-reentrant) locks: no method calls back
+    into the store while holding one.
+    """
+    SHARDS = 16  # Must be a power of two
+
+    def __init__(self):
+        self._shards = [{} for _ in range(self.SHARDS)]
+        self._locks = [threading.Lock() for _ in range(self.SHARDS)]
+
+    def _index(self, timer_id):
+        return hash(timer_id) & (self.SHARDS - 1)
+
+    def get(self, timer_id):
+        """
+        Get timer state or None (lock-free)
+
+        A single dict lookup is atomic, and writers only ever store whole
+        entries or assign single attributes, so readers need no lock; a
+        read racing a tick may see that tick's fields partly applied.
+        """
+        return self._shards[self._index(timer_id)].get(timer_id)
+
+    def put(self, timer_id, state):
+        """Set (replace) timer state (TimerState)"""
+        i = self._index(timer_id)
+        with self._locks[i]:
+            self._shards[i][timer_id] = state
+
+    def update(self, timer_id, updates):
+        """Merge updates into timer state, creating it if missing"""
+        i = self._index(timer_id)
+        with self._locks[i]:
+            timer = self._shards[i].get(timer_id)
+            if timer is None:
+                timer = self._shards[i][timer_id] = TimerState(timer_id)
+            timer.update(updates)
+
+    def set_tick(self, timer_id, elapsed_time, state, last_update):
+        """
+        Write elapsed_time/state/last_update of a timer, creating it if missing
+
+        Hot-path variant of update() that assigns the fields in place
+        instead of merging a temporary dict.
+        """
+        i = self._index(timer_id)
+        with self._locks[i]:
+            timer = self._shards[i].get(timer_id)
+            if timer is None:
+                timer = self._shards[i][timer_id] = TimerState(timer_id)
+            timer.elapsed_time = elapsed_time
+            timer.state = state
+            timer.last_update = last_update
+
+    def set_state(self, timer_id, state):
+        """Set 'state' of a cached timer; unknown timers are ignored"""
+        i = self._index(timer_id)
+        with self._locks[i]:
+            timer = self._shards[i].get(timer_id)
+            if timer is not None:
+                timer.state = state
+
+    def put_many(self, states):
+        """
+        Set (replace) many timer states, locking each shard once
+
+        Args:
+            states: Iterable of TimerState
+        """
+        by_shard = {}
+        for state in states:
+            by_shard.setdefault(self._index(state.timer_id), []).append(state)
+        for i, shard_states in by_shard.items():
+            shard = self._shards[i]
+            with self._locks[i]:
+                for state in shard_states:
+                    shard[state.timer_id] = state
+
+    def remove(self, timer_id):
+        """Remove timer from cache if present"""
+        i = self._index(timer_id)
+        with self._locks[i]:
+            self._shards[i].pop(timer_id, None)
+
+    def set_state_all(self, state):
+        """Set 'state' of every cached timer (one shard locked at a time)"""
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                for timer in shard.values():
+                    timer.state = state
+
+    def clear(self):
+        """Remove all timers (one shard locked at a time)"""
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                shard.clear()
 
 
 class TimerManager:
     """Manages communication with Timer Plugin and caches timer states"""
     
+    MAX_BATCH_MESSAGES = 32  # Flush a batch early once it holds this many
+    UI_FLUSH_INTERVAL = 0.03  # Seconds between coalesced UI tick emits
+    
     def __init__(self, hub_client):
         """
         Initialize Timer Manager
@@ -18,10 +221,117 @@ class TimerManager:
         self.hub_client = hub_client
         # plugin_manager = get_timer_manager()
         self.timer_plugin_id = 'timer-plugin'
-        self.timers = {}  # Cache: {timer_id: timer_state}
-        self.lock = threading.Lock()
+        self.timers = ShardedTimerStore()  # Cache: {timer_id: timer_state}
+        self._batch = threading.local()  # Per-thread queue used by batch()
+        # Generated timer ID suffixes; seeded from the clock so IDs stay
+        # unique across restarts while the plugin keeps old timers
+        self._id_counter = itertools.count(time.time_ns() // 1_000_000)
+        
+        # Bound once; _emit_to_ui runs for every timer tick
+        from app.extensions import socketio
+        self._socketio_emit = socketio.emit
+        self._log = current_app.logger
+        
+        # Pending timer_updated UI emits, newest per timer_id
+        self._socketio = socketio
+        self._ui_pending = {}
+        self._ui_lock = threading.Lock()
+        self._ui_flusher_started = False
+        
+        self._log.info("TimerManager initialized")
+    
+    # ========================================================================
+    # SENDING
+    # ========================================================================
+    
+    def _send(self, msg_type, payload, on_sent=None):
+        """
+        Send message to Timer Plugin, or queue it when inside batch()
+        
+        Args:
+            msg_type: Message type
+            payload: Message payload
+            on_sent: Callable run once the message was actually sent (e.g.
+                     a cache update); inside batch() it runs after a
+                     successful flush and is dropped if the flush fails
+        
+        Returns:
+            bool: Send status; inside batch() only that the message was
+                  queued while the Hub is connected (see flush_now())
+        """
+        pending = getattr(self._batch, 'pending', None)
+        if pending is None:
+            success = self.hub_client.send_to_plugin(self.timer_plugin_id, msg_type, payload)
+            if success and on_sent is not None:
+                on_sent()
+            return success
+        
+        pending.append({'type': msg_type, 'payload': payload})
+        if on_sent is not None:
+            self._batch.on_sent.append(on_sent)
+        if len(pending) >= self.MAX_BATCH_MESSAGES:
+            return self.flush_now()
+        return self.hub_client.connected
+    
+    def flush_now(self):
+        """
+        Send messages queued by the current thread's batch() right away
+        
+        Their on_sent callbacks run only if the send succeeded.
+        
+        Returns:
+            bool: Send status (True if nothing was queued)
+        """
+        pending = getattr(self._batch, 'pending', None)
+        if not pending:
+            return True
+        
+        on_sent = self._batch.on_sent
+        self._batch.pending = []
+        self._batch.on_sent = []
+        if len(pending) == 1:
+            success = self.hub_client.send_to_plugin(
+                self.timer_plugin_id, pending[0]['type'], pending[0]['payload']
+            )
+        else:
+            success = self.hub_client.send_batch_to_plugin(self.timer_plugin_id, pending)
+        
+        if success:
+            for callback in on_sent:
+                callback()
+        else:
+            self._log.error("❌ Failed to send %d batched messages", len(pending))
+        return success
+    
+    @contextmanager
+    def batch(self):
+        """
+        Coalesce Timer Plugin messages sent in this block into one frame
+        
+        Messages keep their order and are sent on exit (or earlier via
+        flush_now() / MAX_BATCH_MESSAGES). Nested blocks join the outer one.
+        The timer cache is updated only after the messages were sent, so a
+        failed flush leaves it unchanged.
         
-        current_app.logger.info("TimerManager initialized")
+        Example:
+            with timer_manager.batch():
+                for penalty_id in penalty_ids:
+                    timer_manager.start_timer(penalty_id)
+        """
+        if getattr(self._batch, 'pending', None) is not None:
+            yield
+            return
+        
+        self._batch.pending = []
+        self._batch.on_sent = []
+        try:
+            yield
+        finally:
+            try:
+                self.flush_now()
+            finally:
+                self._batch.pending = None
+                self._batch.on_sent = None
     
     # ========================================================================
     # TIMER LIFECYCLE
@@ -45,106 +355,104 @@ class TimerManager:
             **kwargs
         }
 
-        success = self.hub_client.send_to_plugin(
-            self.timer_plugin_id,
+        return self._create_timer(payload)
+    
+    def _create_timer(self, payload):
+        """
+        Send a ready create_timer payload and initialize the cache
+        
+        Args:
+            payload: Full create_timer payload (timer_id, timer_type, ...)
+        
+        Returns:
+            bool: Success status
+        """
+        timer_id = payload['timer_id']
+        timer_type = payload['timer_type']
+        
+        # Initialize cache once the plugin got the message
+        state = TimerState(
+            timer_id,
+            timer_type=timer_type,
+            state=STATE_IDLE,
+            initial_time=payload.get('initial_time'),
+            metadata=payload.get('metadata', {}),
+            parent_id=payload.get('parent_id'),
+            limit_time=payload.get('limit_time'),
+        )
+        success = self._send(
             'create_timer',
-            payload
+            payload,
+            partial(self.timers.put, timer_id, state)
         )
         
         if success:
-            # Initialize cache
-            with self.lock:
-                self.timers[timer_id] = {
-                    'timer_id': timer_id,
-                    'timer_type': timer_type,
-                    'state': 'idle',
-                    'initial_time': kwargs.get('initial_time'),
-                    'metadata': kwargs.get('metadata', {}),
-                    'parent_id': kwargs.get('parent_id'),
-                    'limit_time': kwargs.get('limit_time'),
-                }
-            
-            current_app.logger.info(f"✅ Created timer: {timer_id} ({timer_type})")
+            self._log.info("✅ Created timer: %s (%s)", timer_id, timer_type)
         else:
-            current_app.logger.error(f"❌ Failed to create timer: {timer_id}")
+            self._log.error("❌ Failed to create timer: %s", timer_id)
         
         return success
     
     def start_timer(self, timer_id):
         """Start a timer"""
-        success = self.hub_client.send_to_plugin(
-            self.timer_plugin_id,
+        success = self._send(
             'start_timer',
-            {'timer_id': timer_id}
+            {'timer_id': timer_id},
+            partial(self.timers.set_state, timer_id, STATE_RUNNING)
         )
         
         if success:
-            with self.lock:
-                if timer_id in self.timers:
-                    self.timers[timer_id]['state'] = 'running'
-            current_app.logger.info(f"▶️  Started timer: {timer_id}")
+            self._log.info("▶️  Started timer: %s", timer_id)
         
         return success
     
     def pause_timer(self, timer_id):
         """Pause a timer"""
-        success = self.hub_client.send_to_plugin(
-            self.timer_plugin_id,
+        success = self._send(
             'pause_timer',
-            {'timer_id': timer_id}
+            {'timer_id': timer_id},
+            partial(self.timers.set_state, timer_id, STATE_PAUSED)
         )
         
         if success:
-            with self.lock:
-                if timer_id in self.timers:
-                    self.timers[timer_id]['state'] = 'paused'
-            current_app.logger.info(f"⏸️  Paused timer: {timer_id}")
+            self._log.info("⏸️  Paused timer: %s", timer_id)
 
     def resume_timer(self, timer_id):
         """Resume a paused timer"""
-        success = self.hub_client.send_to_plugin(
-            self.timer_plugin_id,
+        success = self._send(
             'resume_timer',
-            {'timer_id': timer_id}
+            {'timer_id': timer_id},
+            partial(self.timers.set_state, timer_id, STATE_RUNNING)
         )
         
         if success:
-            with self.lock:
-                if timer_id in self.timers:
-                    self.timers[timer_id]['state'] = 'running'
-            current_app.logger.info(f"▶️  Resumed timer: {timer_id}")
+            self._log.info("▶️  Resumed timer: %s", timer_id)
         
         return success
     
     def reset_timer(self, timer_id):
         """Reset a timer"""
-        success = self.hub_client.send_to_plugin(
-            self.timer_plugin_id,
+        success = self._send(
             'reset_timer',
-            {'timer_id': timer_id}
+            {'timer_id': timer_id},
+            partial(self.timers.set_state, timer_id, STATE_IDLE)
         )
         
         if success:
-            with self.lock:
-                if timer_id in self.timers:
-                    self.timers[timer_id]['state'] = 'idle'
-            current_app.logger.info(f"⏹️  Reseted timer: {timer_id}")
+            self._log.info("⏹️  Reseted timer: %s", timer_id)
         
         return success
     
     def remove_timer(self, timer_id):
         """Remove a timer"""
-        success = self.hub_client.send_to_plugin(
-            self.timer_plugin_id,
+        success = self._send(
             'remove_timer',
-            {'timer_id': timer_id}
+            {'timer_id': timer_id},
+            partial(self.timers.remove, timer_id)
         )
         
         if success:
-            with self.lock:
-                if timer_id in self.timers:
-                    del self.timers[timer_id]
-            current_app.logger.info(f"🗑️  Removed timer: {timer_id}")
+            self._log.info("🗑️  Removed timer: %s", timer_id)
         
         return success
     
@@ -163,8 +471,7 @@ class TimerManager:
         Returns:
             bool: Success status
         """
-        success = self.hub_client.send_to_plugin(
-            self.timer_plugin_id,
+        success = self._send(
             'adjust_time',
             {
                 'timer_id': timer_id,
@@ -173,8 +480,8 @@ class TimerManager:
         )
         
         if success:
-            current_app.logger.info(
-                f"⏱️  Adjusted timer {timer_id} by {delta}ms"
+            self._log.info(
+                "⏱️  Adjusted timer %s by %sms", timer_id, delta
             )
         
         return success
@@ -190,8 +497,7 @@ class TimerManager:
         Returns:
             bool: Success status
         """
-        success = self.hub_client.send_to_plugin(
-            self.timer_plugin_id,
+        success = self._send(
             'set_elapsed_time',
             {
                 'timer_id': timer_id,
@@ -200,8 +506,8 @@ class TimerManager:
         )
         
         if success:
-            current_app.logger.info(
-                f"⏱️  Set timer {timer_id} to {elapsed_time}ms"
+            self._log.info(
+                "⏱️  Set timer %s to %sms", timer_id, elapsed_time
             )
         
         return success
@@ -220,20 +526,19 @@ class TimerManager:
         Returns:
             bool: Success status
         """
-        success = self.hub_client.send_to_plugin(
-            self.timer_plugin_id,
-            'start_multiple',
-            {'timer_ids': timer_ids}
-        )
+        # Timer Plugin has no start_multiple op; one batch of start_timer
+        # messages is dispatched back-to-back by the plugin
+        with self.batch():
+            for timer_id in timer_ids:
+                self._send('start_timer', {'timer_id': timer_id})
+            success = self.flush_now()
         
         if success:
-            with self.lock:
-                for timer_id in timer_ids:
-                    if timer_id in self.timers:
-                        self.timers[timer_id]['state'] = 'running'
+            for timer_id in timer_ids:
+                self.timers.set_state(timer_id, STATE_RUNNING)
             
-            current_app.logger.info(
-                f"▶️  Started {len(timer_ids)} timers simultaneously"
+            self._log.info(
+                "▶️  Started %d timers simultaneously", len(timer_ids)
             )
         
         return success
@@ -250,20 +555,18 @@ class TimerManager:
             timer_id: Timer identifier
         
         Returns:
-            dict: Timer state or None
+            TimerState: Timer state or None
         """
-        with self.lock:
-            return self.timers.get(timer_id)
+        return self.timers.get(timer_id)
     
     def get_all_timers(self):
-        success = self.hub_client.send_to_plugin(
-            self.timer_plugin_id,
+        success = self._send(
             'get_all_timers',
             {}
         )
 
         if success:
-            current_app.logger.info(
+            self._log.info(
                 "Signal 'get_all_timers' sent to Timer Plugin"
             )
     
@@ -275,17 +578,12 @@ class TimerManager:
             timer_id: Timer to update
             updates: Dictionary of updates
         """
-        with self.lock:
-            if timer_id not in self.timers:
-                self.timers[timer_id] = {'id': timer_id}
-            
-            self.timers[timer_id].update(updates)
+        self.timers.update(timer_id, updates)
     
     def clear_all_timers(self):
         """Clear all cached timers"""
-        with self.lock:
-            self.timers.clear()
-        current_app.logger.info("🗑️  Cleared all timers from cache")
+        self.timers.clear()
+        self._log.info("🗑️  Cleared all timers from cache")
     
     # ========================================================================
     # HIGH-LEVEL BUSINESS LOGIC
@@ -304,18 +602,15 @@ class TimerManager:
         """
         timer_id = f'match-{game_id}'
         
-        self.create_timer(
-            timer_id=timer_id,
-            timer_type='independent',
-            limit_time=duration_minutes * 60 * 1000,
-            pause_at_limit=False,
-            update_interval_ms=100,
-            metadata={
-                'game_id': game_id,
-                'type': 'match',
-                'duration_minutes': duration_minutes
-            }
-        )
+        payload = _MATCH_TEMPLATE.copy()
+        payload['timer_id'] = timer_id
+        payload['limit_time'] = _DURATION_MS.get(duration_minutes) or duration_minutes * 60 * 1000
+        payload['metadata'] = {
+            'game_id': game_id,
+            'type': 'match',
+            'duration_minutes': duration_minutes
+        }
+        self._create_timer(payload)
         
         return timer_id
     
@@ -332,21 +627,18 @@ class TimerManager:
         Returns:
             str: Timer ID
         """
-        timer_id = f'penalty-{player_info.get("number", "unknown")}-{datetime.now().timestamp()}'
-        
-        self.create_timer(
-            timer_id=timer_id,
-            timer_type='dependent',
-            parent_id=match_timer_id,
-            limit_time=duration_minutes * 60 * 1000,
-            pause_at_limit=True,
-            update_interval_ms=1000,
-            metadata={
-                **player_info,
-                'type': 'penalty',
-                'duration_minutes': duration_minutes
-            }
-        )
+        timer_id = f'penalty-{player_info.get("number", "unknown")}-{next(self._id_counter)}'
+        
+        payload = _PENALTY_TEMPLATE.copy()
+        payload['timer_id'] = timer_id
+        payload['parent_id'] = match_timer_id
+        payload['limit_time'] = _DURATION_MS.get(duration_minutes) or duration_minutes * 60 * 1000
+        payload['metadata'] = {
+            **player_info,
+            'type': 'penalty',
+            'duration_minutes': duration_minutes
+        }
+        self._create_timer(payload)
         
         return timer_id
     
@@ -363,16 +655,14 @@ class TimerManager:
         """
         timer_id = f'rafting-{start_number}'
         
-        self.create_timer(
-            timer_id=timer_id,
-            timer_type='independent',
-            update_interval_ms=10,  # 10ms precision for rafting
-            metadata={
-                'team': team_name,
-                'start_number': start_number,
-                'type': 'rafting'
-            }
-        )
+        payload = _FAST_TEMPLATE.copy()  # 10ms precision for rafting
+        payload['timer_id'] = timer_id
+        payload['metadata'] = {
+            'team': team_name,
+            'start_number': start_number,
+            'type': 'rafting'
+        }
+        self._create_timer(payload)
         
         return timer_id
     
@@ -387,23 +677,21 @@ class TimerManager:
         Returns:
             tuple: (blue_timer_id, red_timer_id)
         """
-        blue_id = f'ski-blue-{datetime.now().timestamp()}'
-        red_id = f'ski-red-{datetime.now().timestamp()}'
-        
-        # Create both timers
-        self.create_timer(
-            timer_id=blue_id,
-            timer_type='independent',
-            update_interval_ms=10,
-            metadata={**skier_blue, 'lane': 'blue', 'type': 'skiing'}
-        )
+        pair_id = next(self._id_counter)
+        blue_id = f'ski-blue-{pair_id}'
+        red_id = f'ski-red-{pair_id}'
         
-        self.create_timer(
-            timer_id=red_id,
-            timer_type='independent',
-            update_interval_ms=10,
-            metadata={**skier_red, 'lane': 'red', 'type': 'skiing'}
-        )
+        # Create both timers (sent as one batch)
+        with self.batch():
+            blue = _FAST_TEMPLATE.copy()
+            blue['timer_id'] = blue_id
+            blue['metadata'] = {**skier_blue, 'lane': 'blue', 'type': 'skiing'}
+            self._create_timer(blue)
+            
+            red = _FAST_TEMPLATE.copy()
+            red['timer_id'] = red_id
+            red['metadata'] = {**skier_red, 'lane': 'red', 'type': 'skiing'}
+            self._create_timer(red)
         
         return blue_id, red_id
     
@@ -411,135 +699,50 @@ class TimerManager:
     # WEBSOCKET MESSAGE HANDLERS
     # ========================================================================
     
-    def on_timer_updated(self, msg):
+    # timer_* messages that carry (elapsed_time, state); the value is the
+    # elapsed_time default used when the payload omits it
+    STATE_MESSAGES = {
+        'timer_updated': 0,
+        'timer_started': None,
+        'timer_paused': None,
+        'timer_reset': None,
+        'timer_adjusted': 0,
+    }
+    
+    def on_timer_state_changed(self, msg):
         """
-        Handle timer_updated message from Timer Plugin
+        Handle timer_updated/started/paused/reset/adjusted from Timer Plugin
         
         Args:
-            msg: Update payload
+            msg: Message with 'type' in STATE_MESSAGES and a timer payload
         """
-        msg_type = msg.get('type')
-        payload = msg.get('payload')
-        timer_id = payload.get('timer_id')
-        elapsed_time = payload.get('elapsed_time', 0)
-        state = payload.get('state', 'unknown')
+        msg_type = msg['type']
+        payload = msg['payload']
+        try:
+            # The plugin always sends all three; fall back only if it doesn't
+            timer_id, elapsed_time, state = _get_tick_fields(payload)
+        except KeyError:
+            timer_id = payload.get('timer_id')
+            elapsed_time = payload.get('elapsed_time', self.STATE_MESSAGES.get(msg_type))
+            state = payload.get('state', STATE_UNKNOWN)
         
-        self.update_timer_state(timer_id, {
-            'elapsed_time': elapsed_time,
-            'state': state,
-            'last_update': datetime.now().isoformat()
-        })
+        self.timers.set_tick(timer_id, elapsed_time, state, time.monotonic_ns())
         
-        # Emit to frontend via SocketIO
-        self._emit_to_ui(msg_type, {
-            'timer_id': timer_id,
-            'elapsed_time': elapsed_time,
-            'state': state
-        })
-
-    def on_timer_started(self, msg):
-        """
-        Handle timer_started message from Timer Plugin
-
-        Args:
-            msg: Update payload
-        """
-        msg_type = msg.get('type')
-        payload = msg.get('payload')
-        timer_id = payload.get('timer_id')
-        elapsed_time = payload.get('elapsed_time')
-        state = payload.get('state', 'unknown')
-
-        self.update_timer_state(timer_id, {
-            'elapsed_time': elapsed_time,
-            'state': state,
-            'last_update': datetime.now().isoformat()
-        })
-
-        # Emit to frontend via SocketIO
-        self._emit_to_ui(msg_type, {
-            'timer_id': timer_id,
-            'elapsed_time': elapsed_time,
-            'state': state
-        })
-
-    def on_timer_paused(self, msg):
-        """
-        Handle timer_paused message from Timer Plugin
-
-        Args:
-            msg: Update payload
-        """
-        msg_type = msg.get('type')
-        payload = msg.get('payload')
-        timer_id = payload.get('timer_id')
-        elapsed_time = payload.get('elapsed_time')
-        state = payload.get('state', 'unknown')
-
-        self.update_timer_state(timer_id, {
-            'elapsed_time': elapsed_time,
-            'state': state,
-            'last_update': datetime.now().isoformat()
-        })
-
-        # Emit to frontend via SocketIO
-        self._emit_to_ui(msg_type, {
+        data = {
             'timer_id': timer_id,
             'elapsed_time': elapsed_time,
             'state': state
-        })
-
-    def on_timer_reset(self, msg):
-        """
-        Handle timer_paused message from Timer Plugin
-
-        Args:
-            msg: Update payload
-        """
-        msg_type = msg.get('type')
-        payload = msg.get('payload')
-        timer_id = payload.get('timer_id')
-        elapsed_time = payload.get('elapsed_time')
-        state = payload.get('state', 'unknown')
-
-        self.update_timer_state(timer_id, {
-            'elapsed_time': elapsed_time,
-            'state': state,
-            'last_update': datetime.now().isoformat()
-        })
-
-        # Emit to frontend via SocketIO
-        self._emit_to_ui(msg_type, {
-            'timer_id': timer_id,
-            'elapsed_time': elapsed_time,
-            'state': state
-        })
-
-    def on_timer_adjusted(self, msg):
-        """
-        Handle timer_updated message from Timer Plugin
-
-        Args:
-            msg: Update payload
-        """
-        msg_type = msg.get('type')
-        payload = msg.get('payload')
-        timer_id = payload.get('timer_id')
-        elapsed_time = payload.get('elapsed_time', 0)
-        state = payload.get('state', 'unknown')
-
-        self.update_timer_state(timer_id, {
-            'elapsed_time': elapsed_time,
-            'state': state,
-            'last_update': datetime.now().isoformat()
-        })
-
-        # Emit to frontend via SocketIO
-        self._emit_to_ui(msg_type, {
-            'timer_id': timer_id,
-            'elapsed_time': elapsed_time,
-            'state': state
-        })
+        }
+        
+        # Emit to frontend via SocketIO; ticks are coalesced per timer,
+        # any other state change supersedes a pending tick (emitted under
+        # the UI lock so a flushed older tick can't overtake it)
+        if msg_type == 'timer_updated':
+            self._emit_tick_to_ui(timer_id, data)
+        else:
+            with self._ui_lock:
+                self._ui_pending.pop(timer_id, None)
+                self._emit_to_ui(msg_type, data)
 
     def on_timer_event(self, data):
         """
@@ -552,22 +755,15 @@ class TimerManager:
         event = data.get('event')
         elapsed_time = data.get('elapsed_time', 0)
         
-        current_app.logger.info(
-            f"⏱️  Timer event: {timer_id} - {event} ({elapsed_time}ms)"
+        self._log.info(
+            "⏱️  Timer event: %s - %s (%sms)", timer_id, event, elapsed_time
         )
         
         # Update state based on event
-        state_map = {
-            'limit_reached': 'limit_reached',
-            'paused': 'paused',
-            'resumed': 'running',
-            'stopped': 'stopped',
-            'running': 'running'
-        }
-
-        if event in state_map:
+        state = _EVENT_STATES.get(event)
+        if state is not None:
             self.update_timer_state(timer_id, {
-                'state': state_map[event],
+                'state': state,
                 'elapsed_time': elapsed_time
             })
         
@@ -589,12 +785,12 @@ class TimerManager:
         payload = msg.get('payload')
         timer_id = payload.get('timer_id')
         initial_time = payload.get('initial_time')
-        state = payload.get('state', 'idle')
+        state = payload.get('state', STATE_IDLE)
 
         self.update_timer_state(timer_id, {
             'initial_time': initial_time,
             'state': state,
-            'last_update': datetime.now().isoformat()
+            'last_update': time.monotonic_ns()
         })
 
         # Emit to frontend via SocketIO
@@ -607,34 +803,42 @@ class TimerManager:
     
     def on_timer_plugin_online(self):
         """Handle Timer Plugin coming online"""
-        current_app.logger.info("✅ Timer Plugin is online")
+        self._log.info("✅ Timer Plugin is online")
 
         # Optionally: Re-create timers if needed
         # Or request current state
 
     def on_timer_plugin_offline(self):
         """Handle Timer Plugin going offline"""
-        current_app.logger.warning("⚠️  Timer Plugin is offline")
+        self._log.warning("⚠️  Timer Plugin is offline")
 
         # Mark all timers as disconnected
-        with self.lock:
-            for timer_id in self.timers:
-                self.timers[timer_id]['state'] = 'disconnected'
+        self.timers.set_state_all(STATE_DISCONNECTED)
 
     def on_all_timers(self, msg):
         msg_type = msg.get('type')
         payload = msg.get('payload')
         count = payload.get('count')
-        timers = payload.get('timers')
-        print(f"msg: {msg}")
-        for timer in timers:
-            print(timer)
-
-        # self.update_timer_state(timer_id, {
-        #     'initial_time': initial_time,
-        #     'state': state,
-        #     'last_update': datetime.now().isoformat()
-        # })
+        timers = payload.get('timers') or []
+
+        # Re-populate cache from the snapshot, one lock per shard
+        now = time.monotonic_ns()
+        self.timers.put_many(
+            TimerState(
+                timer['timer_id'],
+                timer_type=timer.get('timer_type'),
+                state=sys.intern(timer.get('state') or STATE_UNKNOWN),
+                initial_time=timer.get('initial_time'),
+                elapsed_time=timer.get('elapsed_time'),
+                metadata=timer.get('metadata') or {},
+                parent_id=timer.get('parent_id') or None,
+                limit_time=timer.get('limit'),
+                last_update=now,
+            )
+            for timer in timers
+            if timer.get('timer_id')
+        )
+        self._log.debug("Got %d timers from Timer Plugin", len(timers))
 
         # Emit to frontend via SocketIO
         self._emit_to_ui(msg_type, {
@@ -679,11 +883,36 @@ class TimerManager:
             })
 
     
+    def _emit_tick_to_ui(self, timer_id, data):
+        """
+        Queue a timer_updated UI emit, keeping only the newest per timer
+
+        The queue is flushed every UI_FLUSH_INTERVAL by a background task
+        started on first use.
+        """
+        with self._ui_lock:
+            self._ui_pending[timer_id] = data
+            if self._ui_flusher_started:
+                return
+            self._ui_flusher_started = True
+        self._socketio.start_background_task(self._flush_ui_loop)
+
+    def _flush_ui_loop(self):
+        """Emit pending timer_updated events every UI_FLUSH_INTERVAL"""
+        while True:
+            self._socketio.sleep(self.UI_FLUSH_INTERVAL)
+            with self._ui_lock:
+                pending = self._ui_pending
+                if not pending:
+                    continue
+                self._ui_pending = {}
+                for data in pending.values():
+                    self._emit_to_ui('timer_updated', data)
+
     def _emit_to_ui(self, msg_type, data):
         """Emit event to UI clients via SocketIO"""
         try:
-            from app.extensions import socketio
             # socketio.emit(event, data, broadcast=True)
-            socketio.emit(msg_type, data)
+            self._socketio_emit(msg_type, data)
         except Exception as e:
-            current_app.logger.error(f"Failed to emit to UI: {e}")
\ No newline at end of file
+            self._log.error("Failed to emit to UI: %s", e)
\ No newline at end of file
@@ -1,6 +1,6 @@
 """Camera model - Camera equipment used in games"""
 from app.extensions import db
-from datetime import datetime
+from app.utils.dict_cache import cached_to_dict
 
 
 class Camera(db.Model):
@@ -13,17 +13,20 @@ class Camera(db.Model):
     model = db.Column(db.String(100), nullable=False)
 
     # Timestamps
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=db.func.current_timestamp(), server_default=db.func.current_timestamp())
+    updated_at = db.Column(db.DateTime, default=db.func.current_timestamp(), server_default=db.func.current_timestamp(), onupdate=db.func.current_timestamp())
 
     # Relationships
-    game_cameras = db.relationship('GameCamera', backref='camera', lazy='dynamic', cascade='all, delete-orphan')
+    game_cameras = db.relationship('GameCamera', backref='camera', cascade='all, delete-orphan')
 
     def __repr__(self):
         return f'<Camera {self.name} ({self.brand} {self.model})>'
 
     def to_dict(self):
-        """Convert to dictionary"""
+        """Convert to dictionary (cached until the row changes)"""
+        return cached_to_dict(self, Camera._build_dict)
+
+    def _build_dict(self):
         return {
             'id': self.id,
             'name': self.name,
@@ -1,6 +1,6 @@
 """Commentator model - Game commentators"""
 from app.extensions import db
-from datetime import datetime
+from app.utils.dict_cache import cached_to_dict
 
 
 class Commentator(db.Model):
@@ -14,27 +14,29 @@ class Commentator(db.Model):
     last_name = db.Column(db.String(100), nullable=False)
     
     # Timestamps
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=db.func.current_timestamp(), server_default=db.func.current_timestamp())
+    updated_at = db.Column(db.DateTime, default=db.func.current_timestamp(), server_default=db.func.current_timestamp(), onupdate=db.func.current_timestamp())
+
+    # Names computed by the database on load instead of on every access
+    full_name = db.column_property(first_name + ' ' + last_name)
+    short_name = db.column_property(
+        db.case(
+            (first_name != '', db.func.substr(first_name, 1, 1) + '. ' + last_name),
+            else_=last_name,
+        )
+    )
 
     # Relationships
-    game_commentators = db.relationship('GameCommentator', backref='commentator', lazy='dynamic', cascade='all, delete-orphan')
+    game_commentators = db.relationship('GameCommentator', backref='commentator', cascade='all, delete-orphan')
 
     def __repr__(self):
         return f'<Commentator {self.first_name} {self.last_name}>'
 
-    @property
-    def full_name(self):
-        """Get full name"""
-        return f"{self.first_name} {self.last_name}"
-
-    @property
-    def short_name(self):
-        """Get short name (first letter of first name + last name)"""
-        return f"{self.first_name[0]}. {self.last_name}" if self.first_name else self.last_name
-
     def to_dict(self):
-        """Convert to dictionary"""
+        """Convert to dictionary (cached until the row changes)"""
+        return cached_to_dict(self, Commentator._build_dict)
+
+    def _build_dict(self):
         return {
             'id': self.id,
             'first_name': self.first_name,
@@ -1,6 +1,6 @@
 """Event model - Game event types"""
 from app.extensions import db
-from datetime import datetime
+from app.utils.dict_cache import cached_to_dict
 
 
 class Event(db.Model):
@@ -22,17 +22,20 @@ class Event(db.Model):
     image_path = db.Column(db.String(500), nullable=True)
     
     # Timestamps
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=db.func.current_timestamp(), server_default=db.func.current_timestamp())
+    updated_at = db.Column(db.DateTime, default=db.func.current_timestamp(), server_default=db.func.current_timestamp(), onupdate=db.func.current_timestamp())
 
     # Relationships
-    game_events = db.relationship('GameEvent', backref='event', lazy='dynamic', cascade='all, delete-orphan')
+    game_events = db.relationship('GameEvent', backref='event', cascade='all, delete-orphan')
 
     def __repr__(self):
         return f'<Event {self.name} (reported: {self.is_reported})>'
 
     def to_dict(self):
-        """Convert to dictionary"""
+        """Convert to dictionary (cached until the row changes)"""
+        return cached_to_dict(self, Event._build_dict)
+
+    def _build_dict(self):
         return {
             'id': self.id,
             'name': self.name,
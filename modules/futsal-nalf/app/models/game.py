@@ -1,6 +1,9 @@
 """Game model - Football games"""
 from app.extensions import db
+from app.utils.counters import increment
 from datetime import datetime
+from functools import cached_property, lru_cache
+from sqlalchemy.orm.base import NO_VALUE
 
 
 class Game(db.Model):
@@ -15,6 +18,9 @@ class Game(db.Model):
     # Walkover constants
     WALKOVER_SCORE = 5
 
+    # to_dict() modes
+    DICT_MODES = ('full', 'summary')
+
     id = db.Column(db.Integer, primary_key=True)
     foreign_id = db.Column(db.String(500), nullable=True)
 
@@ -36,7 +42,7 @@ class Game(db.Model):
     status = db.Column(db.Integer, nullable=False, default=STATUS_NOT_STARTED, index=True)
 
     # League and group
-    league_id = db.Column(db.Integer, db.ForeignKey('leagues.id'), nullable=False, index=True)
+    league_id = db.Column(db.Integer, db.ForeignKey('leagues.id', ondelete='CASCADE'), nullable=False, index=True)
     group_nr = db.Column(db.Integer, nullable=False, default=1)
 
     # Stadium
@@ -52,28 +58,37 @@ class Game(db.Model):
 
     # Relationships defined via backref in Team, League, Stadium
     # New relationships
-    periods = db.relationship('Period', backref='game', lazy='dynamic', cascade='all, delete-orphan', order_by='Period.period_order')
-    game_cameras = db.relationship('GameCamera', backref='game', lazy='dynamic', cascade='all, delete-orphan')
+    periods = db.relationship('Period', backref='game', cascade='all, delete-orphan', order_by='Period.period_order')
+    game_cameras = db.relationship('GameCamera', backref='game', cascade='all, delete-orphan')
     penalty = db.relationship('Penalty', backref='game', uselist=False, cascade='all, delete-orphan')  # One-to-one
-    player_games = db.relationship('PlayerGame', backref='game', lazy='dynamic', cascade='all, delete-orphan')
-    game_events = db.relationship('GameEvent', backref='game', lazy='dynamic', cascade='all, delete-orphan', order_by='GameEvent.time')
-    game_referees = db.relationship('GameReferee', backref='game', lazy='dynamic', cascade='all, delete-orphan')
+    player_games = db.relationship('PlayerGame', backref='game', cascade='all, delete-orphan')
+    game_events = db.relationship('GameEvent', backref='game', cascade='all, delete-orphan', order_by='GameEvent.time')
+    game_referees = db.relationship('GameReferee', backref='game', cascade='all, delete-orphan')
 
     # Indexes
     __table_args__ = (
         db.Index('ix_game_league_round', 'league_id', 'round'),
         db.Index('ix_game_date_status', 'date', 'status'),
+        # League table: seek on league/group/status, read scores from the index
+        # (INCLUDE is PostgreSQL only, other dialects get the key columns)
+        db.Index(
+            'ix_game_league_group_status_cover', 'league_id', 'group_nr', 'status',
+            postgresql_include=[
+                'home_team_id', 'away_team_id', 'home_team_goals', 'away_team_goals',
+                'is_home_team_lost_by_wo', 'is_away_team_lost_by_wo', 'updated_at'
+            ]
+        ),
     )
 
     def __repr__(self):
         return f'<Game {self.id}: {self.home_team.short_name if self.home_team else "?"} vs {self.away_team.short_name if self.away_team else "?"}>'
 
-    @property
+    @cached_property
     def is_walkover(self):
         """Check if game ended with any walkover"""
         return self.is_home_team_lost_by_wo or self.is_away_team_lost_by_wo
 
-    @property
+    @cached_property
     def is_double_walkover(self):
         """Check if both teams lost by walkover"""
         return self.is_home_team_lost_by_wo and self.is_away_team_lost_by_wo
@@ -88,20 +103,20 @@ class Game(db.Model):
         """Check if game is currently live"""
         return self.status == self.STATUS_PENDING
 
-    @property
+    @cached_property
     def score_string(self):
         """Get formatted score string"""
-        if self.home_team_goals is None or self.away_team_goals is None:
+        home_goals = self.home_team_goals
+        away_goals = self.away_team_goals
+        if home_goals is None or away_goals is None:
             return "- : -"
 
-        score = f"{self.home_team_goals} : {self.away_team_goals}"
-
-        if self.is_walkover:
-            score += " (WO)"
+        if self.is_home_team_lost_by_wo or self.is_away_team_lost_by_wo:
+            return f"{home_goals} : {away_goals} (WO)"
 
-        return score
+        return f"{home_goals} : {away_goals}"
 
-    @property
+    @cached_property
     def winner_id(self):
         """Get winner team ID (None if draw or not finished)"""
         if not self.is_finished or self.home_team_goals is None or self.away_team_goals is None:
@@ -117,70 +132,127 @@ class Game(db.Model):
     def set_live(self):
         """Mark game as live"""
         self.status = self.STATUS_PENDING
-        self.updated_at = datetime.utcnow()
 
     def set_finished(self):
         """Mark game as finished"""
         self.status = self.STATUS_FINISHED
-        self.updated_at = datetime.utcnow()
 
     def update_score(self, home_goals, away_goals):
         """Update game score"""
         self.home_team_goals = home_goals
         self.away_team_goals = away_goals
-        self.updated_at = datetime.utcnow()
 
     def update_fouls(self, home_fouls, away_fouls):
         """Update fouls count"""
         self.home_team_fouls = home_fouls
         self.away_team_fouls = away_fouls
-        self.updated_at = datetime.utcnow()
 
     def increment_home_goals(self):
-        """Increment home team goals"""
-        if self.home_team_goals is None:
-            self.home_team_goals = 0
-        self.home_team_goals += 1
-        self.updated_at = datetime.utcnow()
+        """Increment home team goals (atomic UPDATE on flush)"""
+        increment(self, Game.home_team_goals)
 
     def increment_away_goals(self):
-        """Increment away team goals"""
-        if self.away_team_goals is None:
-            self.away_team_goals = 0
-        self.away_team_goals += 1
-        self.updated_at = datetime.utcnow()
+        """Increment away team goals (atomic UPDATE on flush)"""
+        increment(self, Game.away_team_goals)
 
     def set_home_walkover_loss(self):
         """Mark home team as lost by walkover"""
         self.is_home_team_lost_by_wo = True
-        self.updated_at = datetime.utcnow()
 
     def set_away_walkover_loss(self):
         """Mark away team as lost by walkover"""
         self.is_away_team_lost_by_wo = True
-        self.updated_at = datetime.utcnow()
 
     def set_double_walkover(self):
         """Mark both teams as lost by walkover"""
         self.is_home_team_lost_by_wo = True
         self.is_away_team_lost_by_wo = True
-        self.updated_at = datetime.utcnow()
 
     def clear_walkovers(self):
         """Clear all walkover flags"""
         self.is_home_team_lost_by_wo = False
         self.is_away_team_lost_by_wo = False
-        self.updated_at = datetime.utcnow()
+
+    @classmethod
+    def bulk_apply_walkover(cls, game_ids, side=None):
+        """
+        Mark walkover loss on many games with one UPDATE (no commit)
+
+        Args:
+            game_ids: Game IDs to update
+            side: TeamSide.HOME/AWAY of the losing team, None for double walkover
+
+        Returns:
+            Number of updated games
+        """
+        from app.utils.team_side import TeamSide
+
+        values = {}
+        if side is None or side == TeamSide.HOME:
+            values['is_home_team_lost_by_wo'] = True
+        if side is None or side == TeamSide.AWAY:
+            values['is_away_team_lost_by_wo'] = True
+        return cls._bulk_update(game_ids, values)
+
+    @classmethod
+    def bulk_set_status(cls, game_ids, status):
+        """
+        Set status of many games with one UPDATE (no commit)
+
+        Args:
+            game_ids: Game IDs to update
+            status: STATUS_NOT_STARTED, STATUS_PENDING or STATUS_FINISHED
+
+        Returns:
+            Number of updated games
+        """
+        return cls._bulk_update(game_ids, {'status': status})
+
+    @classmethod
+    def bulk_update_scores(cls, scores):
+        """
+        Set scores of many games with one UPDATE (no commit)
+
+        Args:
+            scores: Dict of game_id -> (home_goals, away_goals)
+
+        Returns:
+            Number of updated games
+        """
+        if not scores:
+            return 0
+        home_goals = {game_id: home for game_id, (home, away) in scores.items()}
+        away_goals = {game_id: away for game_id, (home, away) in scores.items()}
+        return cls._bulk_update(scores.keys(), {
+            'home_team_goals': db.case(home_goals, value=cls.id),
+            'away_team_goals': db.case(away_goals, value=cls.id)
+        })
+
+    @classmethod
+    def _bulk_update(cls, game_ids, values):
+        """
+        Run UPDATE games SET values WHERE id IN game_ids
+
+        updated_at is filled in once per statement by the column's onupdate.
+        """
+        game_ids = list(game_ids)
+        if not game_ids:
+            return 0
+        result = db.session.execute(
+            db.update(cls).where(cls.id.in_(game_ids)).values(values),
+            execution_options={'synchronize_session': 'fetch'}
+        )
+        return result.rowcount
 
     @property
     def total_periods(self):
         """Get total number of periods for this game"""
-        return self.periods.count()
+        return len(self.periods)
 
     @property
     def total_cameras(self):
         """Get total number of cameras assigned to this game"""
-        return self.game_cameras.count()
+        return len(self.game_cameras)
 
     @property
     def has_penalty_shootout(self):
@@ -197,25 +269,29 @@ class Game(db.Model):
         - "2 : 2 k. 4:3" (with penalty shootout)
         - "2 : 1 (WO)" (walkover)
         """
-        base_score = self.score_string
-        
-        if self.has_penalty_shootout:
-            return f"{base_score} k. {self.penalty.score_string}"
-        
-        return base_score
+        penalty = self.penalty
+        if penalty is not None:
+            return f"{self.score_string} k. {penalty.score_string}"
+        return self.score_string
 
     def get_periods_list(self):
         """Get ordered list of periods"""
-        return self.periods.order_by('period_order').all()
+        return list(self.periods)
 
     def get_cameras_list(self):
         """Get list of cameras with locations"""
-        return self.game_cameras.all()
+        return list(self.game_cameras)
+
+    def _is_loaded(self, name):
+        """Check if a relationship is already loaded (filter in Python then)"""
+        return db.inspect(self).attrs[name].loaded_value is not NO_VALUE
 
     def get_current_period(self):
         """Get currently active period (status=PENDING)"""
         from app.models.period import Period
-        return self.periods.filter_by(status=Period.STATUS_PENDING).first()
+        if self._is_loaded('periods'):
+            return next((p for p in self.periods if p.status == Period.STATUS_PENDING), None)
+        return Period.query.filter_by(game_id=self.id, status=Period.STATUS_PENDING).first()
 
     def get_penalty_winner_id(self):
         """Get winner ID from penalty shootout (if exists)"""
@@ -233,10 +309,13 @@ class Game(db.Model):
         Returns:
             List of PlayerGame objects
         """
-        query = self.player_games
-        if team_id:
-            query = query.filter_by(team_id=team_id)
-        return query.all()
+        if not team_id:
+            return list(self.player_games)
+        if self._is_loaded('player_games'):
+            return [pg for pg in self.player_games if pg.team_id == team_id]
+
+        from app.models.player_game import PlayerGame
+        return PlayerGame.query.filter_by(game_id=self.id, team_id=team_id).all()
 
     def get_events_list(self, period_id=None, event_id=None):
         """
@@ -249,12 +328,22 @@ class Game(db.Model):
         Returns:
             List of GameEvent objects ordered by time
         """
-        query = self.game_events
+        if not period_id and not event_id:
+            return list(self.game_events)
+        if self._is_loaded('game_events'):
+            return [
+                ge for ge in self.game_events
+                if (not period_id or ge.period_id == period_id)
+                and (not event_id or ge.event_id == event_id)
+            ]
+
+        from app.models.game_event import GameEvent
+        query = GameEvent.query.filter_by(game_id=self.id)
         if period_id:
             query = query.filter_by(period_id=period_id)
         if event_id:
             query = query.filter_by(event_id=event_id)
-        return query.order_by('time').all()
+        return query.order_by(GameEvent.time).all()
 
     def get_referees_list(self, referee_type=None):
         """
@@ -266,25 +355,28 @@ class Game(db.Model):
         Returns:
             List of GameReferee objects
         """
-        query = self.game_referees
-        if referee_type:
-            query = query.filter_by(type=referee_type)
-        return query.all()
+        if not referee_type:
+            return list(self.game_referees)
+        if self._is_loaded('game_referees'):
+            return [gr for gr in self.game_referees if gr.type == referee_type]
+
+        from app.models.game_referee import GameReferee
+        return GameReferee.query.filter_by(game_id=self.id, type=referee_type).all()
 
     @property
     def total_players(self):
         """Get total number of players assigned to this game"""
-        return self.player_games.count()
+        return len(self.player_games)
 
     @property
     def total_events(self):
         """Get total number of events in this game"""
-        return self.game_events.count()
+        return len(self.game_events)
 
     @property
     def total_referees(self):
         """Get total number of referees for this game"""
-        return self.game_referees.count()
+        return len(self.game_referees)
 
     def get_team_stats(self, team_id, include_live=False):
         """
@@ -384,9 +476,22 @@ class Game(db.Model):
         """
         return self.get_team_stats(self.away_team_id, include_live=include_live)
 
-    def to_dict(self):
-        """Convert to dictionary"""
-        return {
+    def to_dict(self, mode='full'):
+        """
+        Convert to dictionary
+
+        Args:
+            mode: 'full' (default) or 'summary' - summary leaves out the
+                  child collections (periods, cameras, penalty, players,
+                  events, referees) and their counts
+
+        Returns:
+            dict
+        """
+        if mode not in self.DICT_MODES:
+            raise ValueError(f"Invalid mode: {mode}. Must be one of {', '.join(self.DICT_MODES)}")
+
+        data = {
             'id': self.id,
             'foreign_id': self.foreign_id,
             'home_team': {
@@ -421,22 +526,99 @@ class Game(db.Model):
             'round': self.round,
             'score_string': self.score_string,
             'winner_id': self.winner_id,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+        if mode == 'summary':
+            return data
+
+        penalty = self.penalty
+        data.update({
             'total_periods': self.total_periods,
             'total_cameras': self.total_cameras,
-            'has_penalty_shootout': self.has_penalty_shootout,
+            'has_penalty_shootout': penalty is not None,
             'full_score_string': self.full_score_string,
             'periods': [p.to_dict() for p in self.get_periods_list()],
             'cameras': [gc.to_dict() for gc in self.get_cameras_list()],
-            'penalty': self.penalty.to_dict() if self.penalty else None,
+            'penalty': penalty.to_dict() if penalty else None,
             'total_players': self.total_players,
             'total_events': self.total_events,
             'total_referees': self.total_referees,
             'players': [pg.to_dict() for pg in self.get_players_list()],
             'events': [ge.to_dict() for ge in self.get_events_list()],
-            'referees': [gr.to_dict() for gr in self.get_referees_list()],
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+            'referees': [gr.to_dict() for gr in self.get_referees_list()]
+        })
+        return data
+
+    @classmethod
+    def to_dict_options(cls, mode='full'):
+        """
+        Get loader options for everything to_dict() reads
+
+        Args:
+            mode: to_dict() mode the options are for ('full' or 'summary')
+
+        Returns:
+            List of options for Query.options()/select().options()
+        """
+        from sqlalchemy.orm import joinedload, selectinload
+
+        if mode == 'summary':
+            return [
+                joinedload(cls.home_team),
+                joinedload(cls.away_team),
+                joinedload(cls.league),
+                joinedload(cls.stadium),
+            ]
+
+        from app.models.game_camera import GameCamera
+        from app.models.game_event import GameEvent
+        from app.models.game_referee import GameReferee
+        from app.models.player_game import PlayerGame
+
+        # joinedload for single rows, selectinload for collections
+        # (avoids a cartesian product of the child lists)
+        return [
+            joinedload(cls.home_team),
+            joinedload(cls.away_team),
+            joinedload(cls.league),
+            joinedload(cls.stadium),
+            joinedload(cls.penalty),
+            selectinload(cls.periods),
+            selectinload(cls.game_cameras).joinedload(GameCamera.camera),
+            selectinload(cls.player_games).options(
+                joinedload(PlayerGame.player),
+                joinedload(PlayerGame.team)
+            ),
+            selectinload(cls.game_events).joinedload(GameEvent.event),
+            selectinload(cls.game_referees).joinedload(GameReferee.referee),
+        ]
+
+    @classmethod
+    def load_for_dict(cls, game_id):
+        """
+        Get game by ID with everything to_dict() needs eager-loaded
+
+        Args:
+            game_id: Game ID
+
+        Returns:
+            Game object or None
+        """
+        return cls.query.options(*cls.to_dict_options()).filter_by(id=game_id).first()
+
+    @classmethod
+    def load_for_summary(cls, game_id):
+        """
+        Get game by ID with what to_dict(mode='summary') needs eager-loaded
+
+        Args:
+            game_id: Game ID
+
+        Returns:
+            Game object or None
+        """
+        return cls.query.options(*cls.to_dict_options('summary')).filter_by(id=game_id).first()
 
     def get_status_text(self):
         """Get human-readable status text"""
@@ -468,69 +650,133 @@ class Game(db.Model):
             - team_id, team_name, team_short_name
             - games, points, wins, draws, loses
             - goals_scored, goals_lost, goal_difference
+
+        Tables are memoized per (league, group, include_live) until a game
+        of the group or a team changes (see _league_table_version).
         """
-        from collections import defaultdict
+        version = cls._league_table_version(league_id, group_nr)
+        table = _cached_league_table(league_id, group_nr, include_live, version)
+        return [dict(row) for row in table]
 
-        # Build query for games
-        query = cls.query.filter_by(league_id=league_id, group_nr=group_nr)
+    @classmethod
+    def _league_table_version(cls, league_id, group_nr):
+        """
+        Get a token that changes whenever a league table may change
+
+        Returns:
+            Tuple of (games count, latest game update, latest team update)
+            for the group; one cheap aggregate query
+        """
+        from app.models.team import Team
 
+        return db.session.execute(
+            db.select(
+                db.func.count(cls.id),
+                db.func.max(cls.updated_at),
+                db.select(db.func.max(Team.updated_at)).scalar_subquery()
+            ).where(cls.league_id == league_id, cls.group_nr == group_nr)
+        ).one().tuple()
+
+    @classmethod
+    def _build_league_table(cls, league_id, group_nr, include_live):
+        """Run the league table query (uncached calculate_league_table)"""
         if include_live:
             # Include finished and live games
-            query = query.filter(cls.status.in_([cls.STATUS_FINISHED, cls.STATUS_PENDING]))
+            status_filter = cls.status.in_([cls.STATUS_FINISHED, cls.STATUS_PENDING])
         else:
             # Only finished games
-            query = query.filter_by(status=cls.STATUS_FINISHED)
-
-        games = query.all()
-
-        # Initialize statistics for each team
-        stats = defaultdict(lambda: {
-            'team_id': None,
-            'team_name': None,
-            'team_short_name': None,
-            'games': 0,
-            'points': 0,
-            'wins': 0,
-            'draws': 0,
-            'loses': 0,
-            'goals_scored': 0,
-            'goals_lost': 0,
-            'goal_difference': 0
-        })
-
-        # Aggregate statistics from each game
-        for game in games:
-            home_stats = game.get_home_team_stats(include_live=include_live)
-            away_stats = game.get_away_team_stats(include_live=include_live)
-
-            if home_stats:
-                for key in home_stats:
-                    stats[game.home_team_id][key] += home_stats[key]
-                stats[game.home_team_id]['team_id'] = game.home_team_id
-                stats[game.home_team_id]['team_name'] = game.home_team.name
-                stats[game.home_team_id]['team_short_name'] = game.home_team.short_name
-
-            if away_stats:
-                for key in away_stats:
-                    stats[game.away_team_id][key] += away_stats[key]
-                stats[game.away_team_id]['team_id'] = game.away_team_id
-                stats[game.away_team_id]['team_name'] = game.away_team.name
-                stats[game.away_team_id]['team_short_name'] = game.away_team.short_name
-
-        # Calculate goal difference
-        for team_id in stats:
-            stats[team_id]['goal_difference'] = (
-                stats[team_id]['goals_scored'] - stats[team_id]['goals_lost']
+            status_filter = cls.status == cls.STATUS_FINISHED
+
+        # Per-game stats of every team (home rows + away rows), summed per team
+        filters = (cls.league_id == league_id, cls.group_nr == group_nr, status_filter)
+        sides = db.union_all(
+            cls._team_stats_select(True, *filters),
+            cls._team_stats_select(False, *filters)
+        ).subquery()
+
+        from app.models.team import Team
+
+        points = db.func.sum(sides.c.points)
+        goals_scored = db.func.sum(sides.c.goals_scored)
+        goals_lost = db.func.sum(sides.c.goals_lost)
+        goal_difference = goals_scored - goals_lost
+
+        rows = db.session.execute(
+            db.select(
+                Team.id,
+                Team.name,
+                Team.short_name,
+                db.func.sum(sides.c.games),
+                points,
+                db.func.sum(sides.c.wins),
+                db.func.sum(sides.c.draws),
+                db.func.sum(sides.c.loses),
+                goals_scored,
+                goals_lost,
+                goal_difference
             )
+            .join(sides, sides.c.team_id == Team.id)
+            .group_by(Team.id, Team.name, Team.short_name)
+            # Sort by: points DESC, goal difference DESC, goals scored DESC
+            .order_by(points.desc(), goal_difference.desc(), goals_scored.desc(), Team.name)
+        ).all()
+
+        return [
+            {
+                'team_id': team_id,
+                'team_name': team_name,
+                'team_short_name': team_short_name,
+                'games': games,
+                'points': points,
+                'wins': wins,
+                'draws': draws,
+                'loses': loses,
+                'goals_scored': goals_scored,
+                'goals_lost': goals_lost,
+                'goal_difference': goal_difference
+            }
+            for (team_id, team_name, team_short_name, games, points, wins, draws,
+                 loses, goals_scored, goals_lost, goal_difference) in rows
+        ]
 
-        # Sort by: points DESC, goal difference DESC, goals scored DESC
-        sorted_stats = sorted(
-            stats.values(),
-            key=lambda x: (x['points'], x['goal_difference'], x['goals_scored']),
-            reverse=True
-        )
+    @classmethod
+    def _team_stats_select(cls, home, *filters):
+        """
+        Build SELECT of one team's stats per game, mirroring get_team_stats()
 
-        return sorted_stats
+        Args:
+            home: True for the home team's row of each game, False for away
+            *filters: WHERE criteria on Game
+
+        Returns:
+            Select with team_id, status, games, points, wins, draws, loses,
+            goals_scored, goals_lost
+        """
+        if home:
+            team_id, team_goals, opponent_goals = cls.home_team_id, cls.home_team_goals, cls.away_team_goals
+            team_lost_by_wo, opponent_lost_by_wo = cls.is_home_team_lost_by_wo, cls.is_away_team_lost_by_wo
+        else:
+            team_id, team_goals, opponent_goals = cls.away_team_id, cls.away_team_goals, cls.home_team_goals
+            team_lost_by_wo, opponent_lost_by_wo = cls.is_away_team_lost_by_wo, cls.is_home_team_lost_by_wo
+
+        # CASE branches are checked in order: walkover loss (also covers
+        # double walkover), walkover win, then the normal result
+        played = db.and_(team_goals.isnot(None), opponent_goals.isnot(None))
+        won = db.and_(played, team_goals > opponent_goals)
+        drawn = db.and_(played, team_goals == opponent_goals)
+        lost = db.and_(played, team_goals < opponent_goals)
+
+        return db.select(
+            team_id.label('team_id'),
+            cls.status.label('status'),
+            db.literal(1).label('games'),
+            db.case((team_lost_by_wo, -1), (opponent_lost_by_wo, 3), (won, 3), (drawn, 1), else_=0).label('points'),
+            db.case((team_lost_by_wo, 0), (opponent_lost_by_wo, 1), (won, 1), else_=0).label('wins'),
+            db.case((team_lost_by_wo, 0), (opponent_lost_by_wo, 0), (drawn, 1), else_=0).label('draws'),
+            db.case((team_lost_by_wo, 1), (opponent_lost_by_wo, 0), (lost, 1), else_=0).label('loses'),
+            db.case((team_lost_by_wo, 0), (opponent_lost_by_wo, cls.WALKOVER_SCORE), (played, team_goals), else_=0).label('goals_scored'),
+            db.case((team_lost_by_wo, cls.WALKOVER_SCORE), (opponent_lost_by_wo, 0), (played, opponent_goals), else_=0).label('goals_lost'),
+        ).where(*filters)
 
     @classmethod
     def get_league_tables_comparison(cls, league_id, group_nr=1):
@@ -547,19 +793,112 @@ class Game(db.Model):
             - 'projected': Table with finished + live games (current scores)
             - 'has_live_games': Boolean indicating if there are live games
         """
-        current_table = cls.calculate_league_table(league_id, group_nr, include_live=False)
-        projected_table = cls.calculate_league_table(league_id, group_nr, include_live=True)
-
-        # Check if there are any live games
-        live_games_count = cls.query.filter_by(
-            league_id=league_id,
-            group_nr=group_nr,
-            status=cls.STATUS_PENDING
-        ).count()
+        version = cls._league_table_version(league_id, group_nr)
+        current_table, projected_table, live_games_count = _cached_league_tables_comparison(
+            league_id, group_nr, version
+        )
 
         return {
-            'current': current_table,
-            'projected': projected_table,
+            'current': [dict(row) for row in current_table],
+            'projected': [dict(row) for row in projected_table],
             'has_live_games': live_games_count > 0,
             'live_games_count': live_games_count
-        }
\ No newline at end of file
+        }
+
+    @classmethod
+    def _build_league_tables_comparison(cls, league_id, group_nr):
+        """
+        Build both comparison tables from one pass over finished + live games
+
+        Returns:
+            Tuple of (current table, projected table, live games count)
+        """
+        from app.models.team import Team
+
+        filters = (
+            cls.league_id == league_id,
+            cls.group_nr == group_nr,
+            cls.status.in_([cls.STATUS_FINISHED, cls.STATUS_PENDING])
+        )
+        sides = db.union_all(
+            cls._team_stats_select(True, *filters),
+            cls._team_stats_select(False, *filters)
+        ).subquery()
+
+        keys = ('games', 'points', 'wins', 'draws', 'loses', 'goals_scored', 'goals_lost')
+        finished = sides.c.status == cls.STATUS_FINISHED
+        live = sides.c.status == cls.STATUS_PENDING
+
+        rows = db.session.execute(
+            db.select(
+                Team.id,
+                Team.name,
+                Team.short_name,
+                *[db.func.sum(db.case((finished, sides.c[key]), else_=0)) for key in keys],
+                *[db.func.sum(sides.c[key]) for key in keys],
+                db.func.sum(db.case((live, 1), else_=0))
+            )
+            .join(sides, sides.c.team_id == Team.id)
+            .group_by(Team.id, Team.name, Team.short_name)
+            .order_by(Team.name)
+        ).all()
+
+        current_table = []
+        projected_table = []
+        live_sides = 0
+        for row in rows:
+            team = {'team_id': row[0], 'team_name': row[1], 'team_short_name': row[2]}
+            current = dict(zip(keys, row[3:10]))
+            projected = dict(zip(keys, row[10:17]))
+            live_sides += row[17]
+
+            # Teams with only live games are not in the current table
+            if current['games']:
+                current['goal_difference'] = current['goals_scored'] - current['goals_lost']
+                current_table.append({**team, **current})
+            projected['goal_difference'] = projected['goals_scored'] - projected['goals_lost']
+            projected_table.append({**team, **projected})
+
+        # Sort by: points DESC, goal difference DESC, goals scored DESC
+        # (stable, so ties stay ordered by team name as in the SQL table)
+        def sort_key(x):
+            return (x['points'], x['goal_difference'], x['goals_scored'])
+        current_table.sort(key=sort_key, reverse=True)
+        projected_table.sort(key=sort_key, reverse=True)
+
+        # Every live game contributes a home and an away row
+        return tuple(current_table), tuple(projected_table), live_sides // 2
+
+
+@lru_cache(maxsize=256)
+def _cached_league_table(league_id, group_nr, include_live, version):
+    """Memoized Game._build_league_table; version keys out stale tables"""
+    return tuple(Game._build_league_table(league_id, group_nr, include_live))
+
+
+@lru_cache(maxsize=256)
+def _cached_league_tables_comparison(league_id, group_nr, version):
+    """Memoized Game._build_league_tables_comparison"""
+    return Game._build_league_tables_comparison(league_id, group_nr)
+
+
+# Derived values cached per instance with cached_property, and the
+# columns they are computed from
+_CACHED_DERIVED = ('is_walkover', 'is_double_walkover', 'score_string', 'winner_id')
+_DERIVED_FROM = (
+    Game.home_team_goals, Game.away_team_goals, Game.status,
+    Game.is_home_team_lost_by_wo, Game.is_away_team_lost_by_wo,
+)
+
+
+def _clear_derived(target, *args):
+    """Drop cached derived values when a source column changes or reloads"""
+    instance_dict = target.__dict__
+    for name in _CACHED_DERIVED:
+        instance_dict.pop(name, None)
+
+
+for _column in _DERIVED_FROM:
+    db.event.listen(_column, 'set', _clear_derived)
+db.event.listen(Game, 'expire', _clear_derived)
+db.event.listen(Game, 'refresh', _clear_derived)
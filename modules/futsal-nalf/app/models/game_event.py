@@ -37,18 +37,17 @@ class GameEvent(db.Model):
     @property
     def time_seconds(self):
         """Get time in seconds"""
-        return self.time / 1000 if self.time else 0
+        time = self.time
+        return time / 1000 if time else 0
 
     @property
     def time_formatted(self):
         """Get formatted time as MM:SS"""
-        seconds = int(self.time_seconds)
-        minutes = seconds // 60
-        secs = seconds % 60
-        return f"{minutes:02d}:{secs:02d}"
+        return _format_time(self.time)
 
     def to_dict(self):
         """Convert to dictionary"""
+        time = self.time
         return {
             'id': self.id,
             'game_id': self.game_id,
@@ -61,9 +60,15 @@ class GameEvent(db.Model):
             'team_name': self.team.name if self.team else None,
             'player_id': self.player_id,
             'player_name': self.player.full_name if self.player else None,
-            'time': self.time,
-            'time_seconds': self.time_seconds,
-            'time_formatted': self.time_formatted,
+            'time': time,
+            'time_seconds': time / 1000 if time else 0,
+            'time_formatted': _format_time(time),
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
+
+
+def _format_time(time_ms):
+    """Format milliseconds as MM:SS using integer math only"""
+    minutes, secs = divmod((time_ms or 0) // 1000, 60)
+    return f"{minutes:02d}:{secs:02d}"
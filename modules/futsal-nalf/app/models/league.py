@@ -1,6 +1,7 @@
 """League model - Football leagues"""
 from app.extensions import db
 from datetime import datetime
+from sqlalchemy.orm.base import NO_VALUE
 
 
 class League(db.Model):
@@ -8,7 +9,7 @@ class League(db.Model):
     __tablename__ = 'leagues'
 
     id = db.Column(db.Integer, primary_key=True)
-    season_id = db.Column(db.Integer, db.ForeignKey('seasons.id'), nullable=False, index=True)
+    season_id = db.Column(db.Integer, db.ForeignKey('seasons.id', ondelete='CASCADE'), nullable=False, index=True)
     name = db.Column(db.String(50), nullable=False)
     foreign_id = db.Column(db.String(500), nullable=True)
 
@@ -25,8 +26,8 @@ class League(db.Model):
 
     # Relationships
     # season relationship defined in Season model (backref)
-    teams = db.relationship('LeagueTeam', backref='league', lazy='dynamic', cascade='all, delete-orphan')
-    games = db.relationship('Game', backref='league', lazy='dynamic', cascade='all, delete-orphan')
+    teams = db.relationship('LeagueTeam', backref='league', cascade='all, delete-orphan')
+    games = db.relationship('Game', backref='league', cascade='all, delete-orphan')
 
     # Composite unique constraint: season + name must be unique
     __table_args__ = (
@@ -39,22 +40,40 @@ class League(db.Model):
     @property
     def total_teams(self):
         """Get total number of teams in this league"""
-        return self.teams.count()
+        return len(self.teams)
 
     @property
     def total_games(self):
         """Get total number of games in this league"""
-        return self.games.count()
+        if self._is_loaded('games'):
+            return len(self.games)
+
+        # COUNT instead of loading every game of the league
+        from app.models.game import Game
+        return Game.query.filter_by(league_id=self.id).count()
+
+    def _is_loaded(self, name):
+        """Check if a relationship is already loaded (filter in Python then)"""
+        return db.inspect(self).attrs[name].loaded_value is not NO_VALUE
 
     def get_teams(self, group_nr=None):
         """Get teams in this league, optionally filtered by group"""
-        query = self.teams
-        if group_nr is not None:
-            query = query.filter_by(group_nr=group_nr)
-        return query.all()
+        if group_nr is None:
+            return list(self.teams)
+        if self._is_loaded('teams'):
+            return [lt for lt in self.teams if lt.group_nr == group_nr]
+
+        from app.models.league_team import LeagueTeam
+        return LeagueTeam.query.filter_by(league_id=self.id, group_nr=group_nr).all()
+
+    def to_dict(self, total_teams=None, total_games=None):
+        """
+        Convert to dictionary
 
-    def to_dict(self):
-        """Convert to dictionary"""
+        Args:
+            total_teams: Precomputed team count (skips the COUNT query)
+            total_games: Precomputed game count (skips the COUNT query)
+        """
         return {
             'id': self.id,
             'season_id': self.season_id,
@@ -66,8 +85,8 @@ class League(db.Model):
             'scorers_url': self.scorers_url,
             'assists_url': self.assists_url,
             'canadian_url': self.canadian_url,
-            'total_teams': self.total_teams,
-            'total_games': self.total_games,
+            'total_teams': self.total_teams if total_teams is None else total_teams,
+            'total_games': self.total_games if total_games is None else total_games,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
\ No newline at end of file
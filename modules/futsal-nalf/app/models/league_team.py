@@ -8,8 +8,8 @@ class LeagueTeam(db.Model):
     __tablename__ = 'league_teams'
 
     id = db.Column(db.Integer, primary_key=True)
-    league_id = db.Column(db.Integer, db.ForeignKey('leagues.id'), nullable=False, index=True)
-    team_id = db.Column(db.Integer, db.ForeignKey('teams.id'), nullable=False, index=True)
+    league_id = db.Column(db.Integer, db.ForeignKey('leagues.id', ondelete='CASCADE'), nullable=False, index=True)
+    team_id = db.Column(db.Integer, db.ForeignKey('teams.id', ondelete='CASCADE'), nullable=False, index=True)
     group_nr = db.Column(db.Integer, nullable=False, default=1)
 
     # Timestamps
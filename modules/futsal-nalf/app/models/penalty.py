@@ -10,7 +10,7 @@ class Penalty(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     
     # Foreign key - one penalty shootout per game
-    game_id = db.Column(db.Integer, db.ForeignKey('games.id'), nullable=False, unique=True, index=True)
+    game_id = db.Column(db.Integer, db.ForeignKey('games.id', ondelete='CASCADE'), nullable=False, unique=True, index=True)
     
     # Penalty shootout results (only goals, no time or fouls)
     home_team_penalties = db.Column(db.Integer, default=0, nullable=False)
@@ -41,17 +41,14 @@ class Penalty(db.Model):
         """Update penalty shootout score"""
         self.home_team_penalties = home_penalties
         self.away_team_penalties = away_penalties
-        self.updated_at = datetime.utcnow()
 
     def increment_home_penalties(self):
         """Increment home team penalty goals"""
         self.home_team_penalties += 1
-        self.updated_at = datetime.utcnow()
 
     def increment_away_penalties(self):
         """Increment away team penalty goals"""
         self.away_team_penalties += 1
-        self.updated_at = datetime.utcnow()
 
     def to_dict(self):
         """Convert to dictionary"""
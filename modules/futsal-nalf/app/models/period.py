@@ -1,5 +1,6 @@
 """Period model - Game periods (halves, quarters, etc.)"""
 from app.extensions import db
+from app.utils.counters import increment
 from datetime import datetime
 
 
@@ -15,7 +16,7 @@ class Period(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     
     # Foreign key
-    game_id = db.Column(db.Integer, db.ForeignKey('games.id'), nullable=False, index=True)
+    game_id = db.Column(db.Integer, db.ForeignKey('games.id', ondelete='CASCADE'), nullable=False, index=True)
     
     # Period configuration
     period_order = db.Column(db.Integer, nullable=False)  # 1, 2, 3, etc.
@@ -41,8 +42,18 @@ class Period(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Unique constraint: period_order must be unique per game
+    # Covering index: score sync and initial time sums read periods of a game
+    # from the index alone. It only adds INCLUDE columns to the unique index,
+    # so it is created on PostgreSQL only.
     __table_args__ = (
         db.UniqueConstraint('game_id', 'period_order', name='unique_game_period_order'),
+        db.Index(
+            'ix_period_game_order_cover', 'game_id', 'period_order',
+            postgresql_include=[
+                'home_team_goals', 'away_team_goals', 'home_team_fouls', 'away_team_fouls',
+                'limit_time', 'status'
+            ]
+        ).ddl_if(dialect='postgresql'),
     )
 
     def __repr__(self):
@@ -65,7 +76,6 @@ class Period(db.Model):
     def update_timer_name(self):
         """Update main_timer_name based on current game state"""
         self.main_timer_name = self.generate_timer_name()
-        self.updated_at = datetime.utcnow()
 
     def get_status_text(self):
         """Get human-readable status text"""
@@ -125,45 +135,36 @@ class Period(db.Model):
             return 0
         
         # Sum limit_time of all previous periods for this game
-        previous_periods = Period.query.filter(
+        return db.session.query(db.func.coalesce(db.func.sum(Period.limit_time), 0)).filter(
             Period.game_id == game_id,
             Period.period_order < period_order
-        ).all()
-        
-        total_time = sum(p.limit_time for p in previous_periods)
-        return total_time
+        ).scalar()
 
     def update_score(self, home_goals, away_goals):
         """Update period score"""
         self.home_team_goals = home_goals
         self.away_team_goals = away_goals
-        self.updated_at = datetime.utcnow()
 
     def update_fouls(self, home_fouls, away_fouls):
         """Update period fouls"""
         self.home_team_fouls = home_fouls
         self.away_team_fouls = away_fouls
-        self.updated_at = datetime.utcnow()
 
     def increment_home_goals(self):
-        """Increment home team goals in this period"""
-        self.home_team_goals += 1
-        self.updated_at = datetime.utcnow()
+        """Increment home team goals in this period (atomic UPDATE on flush)"""
+        increment(self, Period.home_team_goals)
 
     def increment_away_goals(self):
-        """Increment away team goals in this period"""
-        self.away_team_goals += 1
-        self.updated_at = datetime.utcnow()
+        """Increment away team goals in this period (atomic UPDATE on flush)"""
+        increment(self, Period.away_team_goals)
 
     def increment_home_fouls(self):
         """Increment home team fouls in this period"""
         self.home_team_fouls += 1
-        self.updated_at = datetime.utcnow()
 
     def increment_away_fouls(self):
         """Increment away team fouls in this period"""
         self.away_team_fouls += 1
-        self.updated_at = datetime.utcnow()
 
     def sync_to_game(self):
         """
@@ -175,32 +176,8 @@ class Period(db.Model):
         - home_team_fouls = current period's home_team_fouls
         - away_team_fouls = current period's away_team_fouls
         """
-        from app.extensions import db
-        
-        game = self.game
-        if not game:
-            return
-        
-        # Sum goals from all periods
-        all_periods = Period.query.filter_by(game_id=self.game_id).all()
-        total_home_goals = sum(p.home_team_goals for p in all_periods)
-        total_away_goals = sum(p.away_team_goals for p in all_periods)
-        
-        # Update game goals (sum of all periods)
-        game.home_team_goals = total_home_goals
-        game.away_team_goals = total_away_goals
-        
-        # Update game fouls (from current/active period only)
-        current_period = game.get_current_period()
-        if current_period:
-            game.home_team_fouls = current_period.home_team_fouls
-            game.away_team_fouls = current_period.away_team_fouls
-        else:
-            # If no active period, use this period (might be during finish)
-            game.home_team_fouls = self.home_team_fouls
-            game.away_team_fouls = self.away_team_fouls
-        
-        game.updated_at = datetime.utcnow()
+        # If no active period, use this period (might be during finish)
+        Period._sync_game(self.game_id, (Period.id == self.id).desc())
         db.session.commit()
 
     @staticmethod
@@ -215,36 +192,45 @@ class Period(db.Model):
         Args:
             game_id: Game ID
         """
-        from app.extensions import db
+        # No active period - use last period
+        Period._sync_game(game_id, Period.period_order.desc())
+        db.session.commit()
+
+    @staticmethod
+    def _sync_game(game_id, fallback_order):
+        """
+        Recalculate game goals/fouls from its periods in one UPDATE
+
+        Goals are summed and fouls copied by correlated subqueries, so no
+        Period rows are loaded. Games without periods are left untouched.
+
+        Args:
+            game_id: Game ID
+            fallback_order: ORDER BY picking the period to take fouls from
+                            when no period is active
+        """
         from app.models.game import Game
-        
-        game = Game.query.get(game_id)
-        if not game:
-            return
-        
-        periods = Period.query.filter_by(game_id=game_id).order_by(Period.period_order).all()
-        
-        if not periods:
-            return
-        
-        # Sum goals from all periods
-        total_home_goals = sum(p.home_team_goals for p in periods)
-        total_away_goals = sum(p.away_team_goals for p in periods)
-        
-        game.home_team_goals = total_home_goals
-        game.away_team_goals = total_away_goals
-        
-        # Fouls from current/active period
-        current_period = game.get_current_period()
-        if current_period:
-            game.home_team_fouls = current_period.home_team_fouls
-            game.away_team_fouls = current_period.away_team_fouls
-        else:
-            # No active period - use last period
-            last_period = periods[-1] if periods else None
-            if last_period:
-                game.home_team_fouls = last_period.home_team_fouls
-                game.away_team_fouls = last_period.away_team_fouls
-        
-        game.updated_at = datetime.utcnow()
-        db.session.commit()
\ No newline at end of file
+
+        of_game = Period.game_id == game_id
+
+        def total(column):
+            return db.select(db.func.coalesce(db.func.sum(column), 0)).where(of_game).scalar_subquery()
+
+        def fouls(column):
+            # Fouls from current/active period
+            return db.select(column).where(of_game).order_by(
+                (Period.status == Period.STATUS_PENDING).desc(), fallback_order
+            ).limit(1).scalar_subquery()
+
+        db.session.execute(
+            db.update(Game).where(
+                Game.id == game_id,
+                db.select(Period.id).where(of_game).exists()
+            ).values(
+                home_team_goals=total(Period.home_team_goals),
+                away_team_goals=total(Period.away_team_goals),
+                home_team_fouls=fouls(Period.home_team_fouls),
+                away_team_fouls=fouls(Period.away_team_fouls)
+            ),
+            execution_options={'synchronize_session': 'fetch'}
+        )
\ No newline at end of file
@@ -27,7 +27,17 @@ class Player(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    player_games = db.relationship('PlayerGame', backref='player', lazy='dynamic', cascade='all, delete-orphan')
+    player_games = db.relationship('PlayerGame', backref='player', cascade='all, delete-orphan')
+
+    # Partial indexes: goalkeepers/captains are a small subset of players.
+    # Predicates are written like filter_by(is_goalkeeper=True) renders them,
+    # so the planner can prove the query implies the index condition.
+    __table_args__ = (
+        db.Index('ix_player_goalkeepers', 'team_id', 'last_name', 'first_name',
+                 postgresql_where=(is_goalkeeper == True), sqlite_where=(is_goalkeeper == True)),  # noqa: E712
+        db.Index('ix_player_captains', 'team_id', 'last_name', 'first_name',
+                 postgresql_where=(is_captain == True), sqlite_where=(is_captain == True)),  # noqa: E712
+    )
 
     def __repr__(self):
         return f'<Player {self.first_name} {self.last_name} (Team: {self.team_id})>'
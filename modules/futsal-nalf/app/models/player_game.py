@@ -15,9 +15,9 @@ class PlayerGame(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     
     # Foreign keys
-    player_id = db.Column(db.Integer, db.ForeignKey('players.id'), nullable=False, index=True)
-    game_id = db.Column(db.Integer, db.ForeignKey('games.id'), nullable=False, index=True)
-    team_id = db.Column(db.Integer, db.ForeignKey('teams.id'), nullable=False, index=True)
+    player_id = db.Column(db.Integer, db.ForeignKey('players.id', ondelete='CASCADE'), nullable=False, index=True)
+    game_id = db.Column(db.Integer, db.ForeignKey('games.id', ondelete='CASCADE'), nullable=False, index=True)
+    team_id = db.Column(db.Integer, db.ForeignKey('teams.id', ondelete='CASCADE'), nullable=False, index=True)
     
     # Player attributes in this game (copied from Player at time of assignment)
     # These are snapshots to preserve historical data if player changes team/role
@@ -29,9 +29,14 @@ class PlayerGame(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Relationships (player and game via backref in Player/Game)
+    team = db.relationship('Team')
+
     # Unique constraint: player can only be assigned once per game
+    # Index: matches get_players_for_game filter (game, team) + number ordering
     __table_args__ = (
         db.UniqueConstraint('player_id', 'game_id', name='unique_player_game'),
+        db.Index('ix_player_game_game_team_number', 'game_id', 'team_id', 'number'),
     )
 
     def __repr__(self):
@@ -18,7 +18,7 @@ class Season(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    leagues = db.relationship('League', backref='season', lazy='dynamic', cascade='all, delete-orphan')
+    leagues = db.relationship('League', backref='season', cascade='all, delete-orphan')
 
     def __repr__(self):
         return f'<Season {self.number}: {self.name}>'
@@ -26,7 +26,7 @@ class Season(db.Model):
     @property
     def total_leagues(self):
         """Get total number of leagues in this season"""
-        return self.leagues.count()
+        return len(self.leagues)
 
     @property
     def total_games(self):
@@ -34,15 +34,43 @@ class Season(db.Model):
         from app.models.game import Game
         return Game.query.join(League).filter(League.season_id == self.id).count()
 
-    def to_dict(self):
-        """Convert to dictionary"""
+    @classmethod
+    def counts_for(cls, season_ids):
+        """
+        Get league and game counts of several seasons in one query
+
+        Args:
+            season_ids: Season IDs
+
+        Returns:
+            Dict {season_id: (total_leagues, total_games)}; seasons without
+            leagues are missing
+        """
+        from app.models.game import Game
+        rows = db.session.query(
+            League.season_id,
+            db.func.count(db.distinct(League.id)),
+            db.func.count(Game.id)
+        ).outerjoin(Game, Game.league_id == League.id).filter(
+            League.season_id.in_(season_ids)
+        ).group_by(League.season_id).all()
+        return {season_id: (leagues, games) for season_id, leagues, games in rows}
+
+    def to_dict(self, total_leagues=None, total_games=None):
+        """
+        Convert to dictionary
+
+        Args:
+            total_leagues: Precomputed league count (skips the COUNT query)
+            total_games: Precomputed game count (skips the COUNT query)
+        """
         return {
             'id': self.id,
             'number': self.number,
             'name': self.name,
             'foreign_id': self.foreign_id,
-            'total_leagues': self.total_leagues,
-            'total_games': self.total_games,
+            'total_leagues': self.total_leagues if total_leagues is None else total_leagues,
+            'total_games': self.total_games if total_games is None else total_games,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
\ No newline at end of file
@@ -76,7 +76,7 @@ class Settings(db.Model):
         
         # Check if period belongs to the game
         from app.models.period import Period
-        period = Period.query.get(settings.current_period_id)
+        period = db.session.get(Period, settings.current_period_id)
         
         if not period:
             return False
@@ -8,12 +8,10 @@ from app.managers.team_scraper_manager import TeamScraperManager
 from app.managers.game_manager import GameManager
 from app.managers.game_scraper_manager import GameScraperManager
 from app.managers.league_manager import LeagueManager
-from app.models.team import Team
 from app.models.period import Period
 from app.models.settings import Settings
 import logging
 import time
-import os
 
 # Import CRUD routes for Season, League, Game
 from app import routes_crud  # noqa: F401
@@ -45,9 +43,9 @@ def ui_dashboard():
     period = None
     game = None
     if settings.current_period_id:
-        period = Period.query.get(settings.current_period_id)
+        period = db.session.get(Period, settings.current_period_id)
         if period:
-            game = Game.query.get(period.game_id)
+            game = db.session.get(Game, period.game_id)
     
     # Get current timers from Settings
     current_timers = settings.get_current_timers()
@@ -81,7 +79,7 @@ def index():
     penalty = None
     
     if settings.current_game_id:
-        game = Game.query.get(settings.current_game_id)
+        game = db.session.get(Game, settings.current_game_id)
         if game:
             periods = game.get_periods_list()
             penalty = game.penalty
@@ -108,7 +106,7 @@ def start_period(period_id):
         return redirect(url_for('index'))
     
     # Check if this period can be started
-    game = Game.query.get(period.game_id)
+    game = db.session.get(Game, period.game_id)
     if not game:
         flash('Nie znaleziono meczu', 'error')
         return redirect(url_for('index'))
@@ -169,7 +167,7 @@ def finish_period(period_id):
         Settings.set_current_period(None)
         
         # Check if this was the last period
-        game = Game.query.get(period.game_id)
+        game = db.session.get(Game, period.game_id)
         if game:
             all_periods = game.get_periods_list()
             all_finished = all(p.status == Period.STATUS_FINISHED for p in all_periods)
@@ -260,18 +258,6 @@ def view_team(team_id):
         flash('Nie znaleziono zespołu', 'error')
         return redirect(url_for('list_teams'))
 
-    logos_dir = 'static/images/logos'
-    logos = []
-
-    if os.path.exists(logos_dir):
-        allowed_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp'}
-        for file in os.listdir(logos_dir):
-            if any(file.lower().endswith(ext) for ext in allowed_extensions):
-                logos.append({
-                    'filename': file,
-                    'path': f'/static/images/logos/{file}'
-                })
-
     return render_template('teams/view.html', team=team)
 
 
@@ -358,7 +344,6 @@ def scrape_games(league_id=None):
     """Scrape games from NALF league pages (async)"""
     selected_league_id = int(request.form.get('league_id', league_id or 0))
     league = league_manager.get_league_by_id(selected_league_id)
-    teams = Team.query.order_by(Team.name).all()
     if request.method == 'POST':
         try:
             
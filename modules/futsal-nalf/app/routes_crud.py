@@ -3,8 +3,10 @@ from flask import render_template, jsonify, current_app, flash, redirect, url_fo
 from app.managers.season_manager import SeasonManager
 from app.managers.league_manager import LeagueManager
 from app.managers.game_manager import GameManager
+from app.managers.team_manager import TeamManager
+from app.models.game import Game
+from app.models.season import Season
 from app.models.stadium import Stadium
-from app.models.team import Team
 from datetime import datetime
 import logging
 
@@ -13,6 +15,7 @@ logger = logging.getLogger(__name__)
 season_manager = SeasonManager()
 league_manager = LeagueManager()
 game_manager = GameManager()
+team_manager = TeamManager()
 
 
 # =========================
@@ -143,7 +146,7 @@ def view_league(league_id):
 @current_app.route('/seasons/<int:season_id>/leagues/create', methods=['GET', 'POST'])
 def create_league(season_id=None):
     """Create new league"""
-    seasons = season_manager.get_all_seasons()
+    seasons = season_manager.get_all_seasons_lite()
     
     if request.method == 'POST':
         try:
@@ -342,7 +345,7 @@ def view_game(game_id):
 def create_game(league_id=None):
     """Create new game"""
     leagues = league_manager.get_all_leagues()
-    teams = Team.query.order_by(Team.name).all()
+    teams = team_manager.get_all_teams_lite()
     stadiums = Stadium.query.order_by(Stadium.city, Stadium.name).all()
     
     if request.method == 'POST':
@@ -392,7 +395,7 @@ def edit_game(game_id):
         flash('Nie znaleziono meczu', 'error')
         return redirect(url_for('list_games'))
     
-    teams = Team.query.order_by(Team.name).all()
+    teams = team_manager.get_all_teams_lite()
     stadiums = Stadium.query.order_by(Stadium.city, Stadium.name).all()
     penalty_manager = PenaltyManager()
     
@@ -457,7 +460,7 @@ def prepare_game_for_broadcast(game_id):
         return redirect(url_for('list_games'))
     
     # Check if game already has periods
-    if game.periods.count() > 0:
+    if game.total_periods > 0:
         flash('Mecz ma już utworzone okresy', 'warning')
         return redirect(url_for('edit_game', game_id=game_id))
     
@@ -487,7 +490,7 @@ def select_game_for_broadcast(game_id):
         return redirect(url_for('list_games'))
     
     # Check if game has periods
-    if game.periods.count() == 0:
+    if game.total_periods == 0:
         flash('Mecz nie ma utworzonych okresów. Najpierw przygotuj mecz do transmisji.', 'error')
         return redirect(url_for('edit_game', game_id=game_id))
     
@@ -562,8 +565,9 @@ def delete_game(game_id):
 def api_list_seasons():
     """API: List all seasons"""
     seasons = season_manager.get_all_seasons()
+    counts = Season.counts_for([season.id for season in seasons])
     return jsonify({
-        'seasons': [season.to_dict() for season in seasons]
+        'seasons': [season.to_dict(*counts.get(season.id, (0, 0))) for season in seasons]
     })
 
 
@@ -606,24 +610,35 @@ def api_list_games():
     league_id = request.args.get('league_id', type=int)
     team_id = request.args.get('team_id', type=int)
     status = request.args.get('status', type=int)
+    mode = request.args.get('mode', 'full')
+    
+    if mode not in Game.DICT_MODES:
+        return jsonify({'error': f'Invalid mode: {mode}'}), 400
     
     games = game_manager.get_all_games(
         league_id=league_id,
         team_id=team_id,
-        status=status
+        status=status,
+        for_dict=True,
+        mode=mode
     )
     
     return jsonify({
-        'games': [game.to_dict() for game in games]
+        'games': [game.to_dict(mode) for game in games]
     })
 
 
 @current_app.route('/api/games/<int:game_id>')
 def api_get_game(game_id):
     """API: Get single game"""
-    game = game_manager.get_game_by_id(game_id)
+    mode = request.args.get('mode', 'full')
+    
+    if mode not in Game.DICT_MODES:
+        return jsonify({'error': f'Invalid mode: {mode}'}), 400
+    
+    game = game_manager.get_game_for_dict(game_id, mode)
     
     if not game:
         return jsonify({'error': 'Game not found'}), 404
     
-    return jsonify(game.to_dict())
\ No newline at end of file
+    return jsonify(game.to_dict(mode))
\ No newline at end of file
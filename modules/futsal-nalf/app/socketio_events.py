@@ -110,15 +110,16 @@ def handle_timer_start(data):
             main_timer["state"] = "running"
             Settings.update_main_timer(main_timer)
             
-            # Start all penalty timers (dependent)
+            # Start all penalty timers (dependent), sent as one batch
             penalties = current_timers.get("penalties", [])
-            for penalty in penalties:
-                penalty_id = penalty.get("timer_id")
-                if penalty_id:
-                    # Start penalty timer
-                    timer_manager.start_timer(penalty_id)
-                    penalty["state"] = "running"
-                    Settings.update_penalty_timer(penalty_id, penalty)
+            with timer_manager.batch():
+                for penalty in penalties:
+                    penalty_id = penalty.get("timer_id")
+                    if penalty_id:
+                        # Start penalty timer
+                        timer_manager.start_timer(penalty_id)
+                        penalty["state"] = "running"
+                        Settings.update_penalty_timer(penalty_id, penalty)
         else:
             # Penalty timer started
             penalties = current_timers.get("penalties", [])
@@ -162,18 +163,19 @@ def handle_timer_pause(data):
             main_timer["initial_time"] = timer_state.get("elapsed_time", main_timer.get("initial_time", 0))
             Settings.update_main_timer(main_timer)
             
-            # Pause all penalty timers (dependent)
+            # Pause all penalty timers (dependent), sent as one batch
             penalties = current_timers.get("penalties", [])
-            for penalty in penalties:
-                penalty_id = penalty.get("timer_id")
-                if penalty_id:
-                    # Pause penalty timer
-                    timer_manager.pause_timer(penalty_id)
-                    penalty_state = timer_manager.get_timer_state(penalty_id)
-                    if penalty_state:
-                        penalty["state"] = "paused"
-                        penalty["initial_time"] = penalty_state.get("elapsed_time", penalty.get("initial_time", 0))
-                        Settings.update_penalty_timer(penalty_id, penalty)
+            with timer_manager.batch():
+                for penalty in penalties:
+                    penalty_id = penalty.get("timer_id")
+                    if penalty_id:
+                        # Pause penalty timer
+                        timer_manager.pause_timer(penalty_id)
+                        penalty_state = timer_manager.get_timer_state(penalty_id)
+                        if penalty_state:
+                            penalty["state"] = "paused"
+                            penalty["initial_time"] = penalty_state.get("elapsed_time", penalty.get("initial_time", 0))
+                            Settings.update_penalty_timer(penalty_id, penalty)
     else:
         # Penalty timer paused
         penalties = current_timers.get("penalties", [])
@@ -219,15 +221,16 @@ def handle_timer_resume(data):
             main_timer["state"] = "running"
             Settings.update_main_timer(main_timer)
             
-            # Resume all penalty timers (dependent)
+            # Resume all penalty timers (dependent), sent as one batch
             penalties = current_timers.get("penalties", [])
-            for penalty in penalties:
-                penalty_id = penalty.get("timer_id")
-                if penalty_id and penalty.get("state") == "paused":
-                    # Resume penalty timer
-                    timer_manager.resume_timer(penalty_id)
-                    penalty["state"] = "running"
-                    Settings.update_penalty_timer(penalty_id, penalty)
+            with timer_manager.batch():
+                for penalty in penalties:
+                    penalty_id = penalty.get("timer_id")
+                    if penalty_id and penalty.get("state") == "paused":
+                        # Resume penalty timer
+                        timer_manager.resume_timer(penalty_id)
+                        penalty["state"] = "running"
+                        Settings.update_penalty_timer(penalty_id, penalty)
         else:
             # Penalty timer resumed
             penalties = current_timers.get("penalties", [])
@@ -669,7 +672,7 @@ def handle_timer_get_state(data):
     state = timer_manager.get_timer_state(timer_id)
     
     if state:
-        emit('timer_state', state)
+        emit('timer_state', state.to_dict())
     else:
         emit('error', {'message': f'Timer {timer_id} not found'})
 
@@ -0,0 +1,29 @@
+"""Counter helpers - atomic in-database increments of model columns"""
+from sqlalchemy import func
+from sqlalchemy.orm import object_session
+
+
+def increment(obj, column, by=1):
+    """
+    Set column = column + by for obj, computed by the database
+
+    Emits UPDATE ... SET col = COALESCE(col, 0) + by instead of writing a
+    value read earlier, so concurrent increments are not lost and no
+    SELECT is needed first. The UPDATE is flushed right away: until then
+    the attribute would hold the SQL expression, not a number. The
+    attribute is reloaded on next access.
+
+    Args:
+        obj: Model instance (persistent, attached to a session)
+        column: Mapped column attribute (e.g. Game.home_team_goals)
+        by: Increment step (default: 1)
+
+    Raises:
+        ValueError if obj is not attached to a session
+    """
+    session = object_session(obj)
+    if session is None:
+        raise ValueError(f"{obj!r} is not attached to a session")
+
+    setattr(obj, column.key, func.coalesce(column, 0) + by)
+    session.flush()
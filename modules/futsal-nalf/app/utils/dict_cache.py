@@ -0,0 +1,86 @@
+"""Dict cache - reuse to_dict() output of rows that did not change"""
+from collections import OrderedDict
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from app.extensions import db
+import threading
+
+MAX_ENTRIES = 4096
+
+_cache = OrderedDict()
+_lock = threading.Lock()
+
+
+def cached_to_dict(obj, build):
+    """
+    Return build(obj), reusing the result while the row is unchanged
+
+    Entries are keyed on (model, id) and stamped with updated_at; a
+    different updated_at, or an UPDATE/DELETE run by this process through
+    the ORM (flushes and session.execute(update(Model)/delete(Model)))
+    drops the entry. updated_at has one-second resolution, so UPDATEs that
+    bypass the session (connection/engine level) must call invalidate().
+    Objects not yet flushed or with pending changes are always rebuilt.
+
+    Args:
+        obj: Model instance with id and updated_at columns
+        build: Callable producing the dict
+
+    Returns:
+        dict: Shallow copy (callers may mutate it)
+    """
+    if obj.id is None or obj.updated_at is None or inspect(obj).modified:
+        return build(obj)
+
+    key = (type(obj).__name__, obj.id)
+    stamp = obj.updated_at
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None and entry[0] == stamp:
+            _cache.move_to_end(key)
+            return dict(entry[1])
+
+    data = build(obj)
+    with _lock:
+        _cache[key] = (stamp, data)
+        _cache.move_to_end(key)
+        if len(_cache) > MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return dict(data)
+
+
+def invalidate(model=None):
+    """
+    Drop cached dicts of a model, or of every model
+
+    Args:
+        model: Model class (default: all)
+    """
+    with _lock:
+        if model is None:
+            _cache.clear()
+            return
+        for key in [key for key in _cache if key[0] == model.__name__]:
+            del _cache[key]
+
+
+def _invalidate(mapper, connection, target):
+    """Drop cached dict of an updated/deleted row"""
+    with _lock:
+        _cache.pop((type(target).__name__, target.id), None)
+
+
+# updated_at has only second resolution with CURRENT_TIMESTAMP defaults,
+# so writes within one second would otherwise keep hitting the old entry
+event.listen(db.Model, 'after_update', _invalidate, propagate=True)
+event.listen(db.Model, 'after_delete', _invalidate, propagate=True)
+
+
+def _invalidate_bulk(orm_execute_state):
+    """Drop cached dicts of a model hit by a bulk UPDATE/DELETE"""
+    if orm_execute_state.is_update or orm_execute_state.is_delete:
+        mapper = orm_execute_state.bind_mapper
+        invalidate(mapper.class_ if mapper is not None else None)
+
+
+event.listen(Session, 'do_orm_execute', _invalidate_bulk)
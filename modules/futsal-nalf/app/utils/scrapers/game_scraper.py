@@ -43,15 +43,12 @@ class GameScraper:
                 logger.warning(f"No tbody found on page {page_url}")
                 return games
 
-            print(tbody)
-            
             # Find all team rows
             rows = tbody.find_all('tr')
             
             for row in rows:
-                print(f"<tr>: {row}")
                 game_data = self._extract_game_data_from_row(row)
-                print(f"    game_data: {game_data}")
+                logger.debug("Parsed row: %s", game_data)
                 if game_data:
                     games.append(game_data)
             
@@ -1,6 +1,8 @@
 """NALF Futsal Scraper - scraping team data from nalffutsal.pl"""
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 import logging
 
@@ -11,9 +13,14 @@ class TeamScraper:
     """Scraper for NALF Futsal league tables"""
     
     BASE_URL = "https://nalffutsal.pl"
+    MAX_WORKERS = 8
     
     def __init__(self):
         self.session = requests.Session()
+        # Pool sized for MAX_WORKERS concurrent league fetches
+        adapter = HTTPAdapter(pool_maxsize=self.MAX_WORKERS * 2)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
@@ -43,15 +50,12 @@ class TeamScraper:
                 logger.warning(f"No tbody found on page {page_url}")
                 return teams
 
-            print(tbody)
-            
             # Find all team rows
             rows = tbody.find_all('tr')
             
             for row in rows:
-                print(f"<tr>: {row}")
                 team_data = self._extract_team_from_row(row)
-                print(f"    team_data: {team_data}")
+                logger.debug("Parsed row: %s", team_data)
                 if team_data:
                     teams.append(team_data)
             
@@ -118,9 +122,15 @@ class TeamScraper:
         all_teams = []
         seen_urls = set()
         
-        for url in page_urls:
-            teams = self.scrape_league_table(url)
-            
+        # Fetch pages concurrently (network-bound); map() keeps page order
+        if len(page_urls) > 1:
+            workers = min(self.MAX_WORKERS, len(page_urls))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self.scrape_league_table, page_urls))
+        else:
+            results = [self.scrape_league_table(url) for url in page_urls]
+        
+        for teams in results:
             # Add only unique teams (by team_url)
             for team in teams:
                 if team['team_url'] not in seen_urls:
@@ -0,0 +1,26 @@
+"""Team side enum - home/away dispatch for score and foul counters"""
+from enum import IntEnum
+
+
+class TeamSide(IntEnum):
+    """Side of the pitch a team plays on in a game"""
+    HOME = 0
+    AWAY = 1
+
+    @classmethod
+    def parse(cls, value):
+        """
+        Parse 'home'/'away' (case-insensitive) into TeamSide
+
+        Meant to be called once at the route layer, so managers can
+        dispatch on the int value without re-normalizing strings.
+
+        Raises:
+            ValueError if value is not 'home' or 'away'
+        """
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls[value.upper()]
+        except (KeyError, AttributeError):
+            raise ValueError(f"Invalid team: {value}. Must be 'home' or 'away'")
@@ -0,0 +1,59 @@
+"""Transaction helpers - let callers group manager writes into one commit"""
+from contextlib import contextmanager
+from app.extensions import db
+
+_DEPTH_KEY = 'unit_of_work_depth'
+_FAILED_KEY = 'unit_of_work_failed'
+
+
+@contextmanager
+def unit_of_work():
+    """
+    Run several manager operations in a single transaction
+
+    Inside the block managers only flush (PKs are still assigned); the
+    outermost block commits once on success and rolls back on error.
+    If a manager rolled back and swallowed its error, the block raises
+    RuntimeError instead of committing a partial result.
+
+    Example:
+        with unit_of_work():
+            player_manager.create_player(...)
+            player_game_manager.assign_player_to_game(...)
+    """
+    session = db.session
+    depth = session.info.get(_DEPTH_KEY, 0)
+    session.info[_DEPTH_KEY] = depth + 1
+    try:
+        yield session
+        if depth == 0:
+            if session.info.pop(_FAILED_KEY, False):
+                raise RuntimeError("Unit of work rolled back by a failed operation")
+            session.commit()
+    except Exception:
+        if depth == 0:
+            session.info.pop(_FAILED_KEY, None)
+            session.rollback()
+        raise
+    finally:
+        session.info[_DEPTH_KEY] = depth
+
+
+def in_unit_of_work():
+    """Check if called inside unit_of_work()"""
+    return db.session.info.get(_DEPTH_KEY, 0) > 0
+
+
+def commit():
+    """Commit, or only flush when running inside unit_of_work()"""
+    if in_unit_of_work():
+        db.session.flush()
+    else:
+        db.session.commit()
+
+
+def rollback():
+    """Roll back; inside unit_of_work() also mark the whole unit as failed"""
+    if in_unit_of_work():
+        db.session.info[_FAILED_KEY] = True
+    db.session.rollback()
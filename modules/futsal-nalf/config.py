@@ -7,6 +7,20 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///database.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = False
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        # Compiled-statement cache; default 500 is tight once every manager's
+        # filter_by/order_by variants are warm
+        'query_cache_size': 1200,
+        'pool_pre_ping': True,
+        'pool_recycle': 1800,
+    }
+    # Pool sizing only applies to server databases (SQLite uses its own pools)
+    if not SQLALCHEMY_DATABASE_URI.startswith('sqlite'):
+        SQLALCHEMY_ENGINE_OPTIONS.update({
+            'pool_size': 10,
+            'max_overflow': 20,
+            'pool_timeout': 30,
+        })
 
     SOCKETIO_CORS_ALLOWED_ORIGINS = "*"
     SOCKETIO_ASYNC_MODE = 'threading'
@@ -144,6 +144,8 @@ func (p *Plugin) handleMessage(msg *Message) {
 		p.handleGetAllTimers(msg)
 	case "remove_timer":
 		p.handleRemoveTimer(msg)
+	case "batch":
+		p.handleBatch(msg)
 	case "ping":
 		p.handlePing(msg)
 	case "shutdown":
@@ -158,6 +160,37 @@ func (p *Plugin) handleMessage(msg *Message) {
 // MESSAGE HANDLERS
 // ============================================================================
 
+// handleBatch dispatches coalesced messages in the order they were queued
+func (p *Plugin) handleBatch(msg *Message) {
+	items, ok := msg.Payload["messages"].([]interface{})
+	if !ok {
+		p.sendError(msg.From, "batch", "messages is required")
+		return
+	}
+
+	for _, item := range items {
+		entry, ok := item.(map[string]interface{})
+		if !ok {
+			continue
+		}
+		msgType, _ := entry["type"].(string)
+		if msgType == "" || msgType == "batch" {
+			continue
+		}
+		payload, _ := entry["payload"].(map[string]interface{})
+		if payload == nil {
+			payload = make(map[string]interface{})
+		}
+		p.handleMessage(&Message{
+			From:      msg.From,
+			To:        msg.To,
+			Type:      msgType,
+			Payload:   payload,
+			Timestamp: msg.Timestamp,
+		})
+	}
+}
+
 func (p *Plugin) handleCreateTimer(msg *Message) {
 	timerID, ok := msg.Payload["timer_id"].(string)
 	if !ok {